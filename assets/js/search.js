@@ -0,0 +1,126 @@
+// 블로그 검색: scripts/search_index.py가 만든 정적 역색인에서 검색어에 해당하는 샤드만 받아 검색합니다.
+(function () {
+  var script = document.currentScript;
+  var base = script.getAttribute("data-base");
+  var input = document.getElementById("search-input");
+  var status = document.getElementById("search-status");
+  var results = document.getElementById("search-results");
+  var MAX_RESULTS = 50;
+
+  // search_index.py의 tokenize와 같은 규칙 (한글·한자는 bigram, 영문·숫자는 단어)
+  var TOKEN_PATTERN = /[\u{AC00}-\u{D7A3}\u{4E00}-\u{9FFF}]+|[a-z0-9]+/gu;
+  var BIGRAM_SCRIPT = /^[\u{AC00}-\u{D7A3}\u{4E00}-\u{9FFF}]/u;
+
+  function tokenize(text) {
+    var terms = {};
+    var runs = text.normalize("NFKC").toLowerCase().match(TOKEN_PATTERN) || [];
+    runs.forEach(function (run) {
+      var chars = Array.from(run);
+      if (BIGRAM_SCRIPT.test(run)) {
+        for (var i = 0; i < chars.length - 1; i++) terms[chars[i] + chars[i + 1]] = true;
+      } else if (chars.length >= 2) {
+        terms[run] = true;
+      }
+    });
+    return Object.keys(terms);
+  }
+
+  // UTF-8 바이트의 FNV-1a 32비트 해시 (search_index.py의 term_shard와 동일)
+  function termShard(term, shards) {
+    var hash = 0x811c9dc5;
+    new TextEncoder().encode(term).forEach(function (byte) {
+      hash = Math.imul(hash ^ byte, 0x01000193) >>> 0;
+    });
+    return hash % shards;
+  }
+
+  var cache = {};
+  function fetchJSON(path) {
+    if (!cache[path]) {
+      cache[path] = fetch(base + path).then(function (response) {
+        return response.ok ? response.json() : null;
+      });
+    }
+    return cache[path];
+  }
+
+  function decode(deltas) {
+    var ids = [];
+    var last = 0;
+    for (var i = 0; i < deltas.length; i++) {
+      last += deltas[i];
+      ids.push(last);
+    }
+    return ids;
+  }
+
+  function intersect(lists) {
+    lists.sort(function (a, b) { return a.length - b.length; });
+    return lists.slice(1).reduce(function (result, list) {
+      var set = new Set(list);
+      return result.filter(function (id) { return set.has(id); });
+    }, lists[0]);
+  }
+
+  function escapeHTML(text) {
+    return text.replace(/[&<>"']/g, function (c) {
+      return { "&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#39;" }[c];
+    });
+  }
+
+  function render(docs) {
+    results.innerHTML = docs.map(function (doc) {
+      var external = /^https?:/.test(doc[1]) ? ' target="_blank" rel="noopener"' : "";
+      return "<li><span class=\"post-meta\">" + doc[2].replace(/-/g, ". ") + "</span>" +
+        "<h3><a class=\"post-link\" href=\"" + escapeHTML(doc[1]) + "\"" + external + ">" +
+        escapeHTML(doc[0]) + "</a></h3></li>";
+    }).join("");
+  }
+
+  var pending = 0;
+  function search(query) {
+    var current = ++pending;
+    var terms = tokenize(query);
+    if (!terms.length) {
+      status.textContent = query.trim() ? "두 글자 이상 입력하세요." : "";
+      results.innerHTML = "";
+      return;
+    }
+
+    fetchJSON("meta.json").then(function (meta) {
+      if (!meta) throw new Error("검색 색인이 없습니다.");
+      return Promise.all(terms.map(function (term) {
+        return fetchJSON("index/" + termShard(term, meta.shards) + ".json").then(function (shard) {
+          return decode((shard && shard[term]) || []);
+        });
+      })).then(function (lists) {
+        // 최신 문서(큰 번호)부터 표시
+        var ids = intersect(lists).reverse().slice(0, MAX_RESULTS);
+        return Promise.all(ids.map(function (id) {
+          return fetchJSON("docs/" + Math.floor(id / meta.doc_shard_size) + ".json").then(function (docs) {
+            return docs && docs[id % meta.doc_shard_size];
+          });
+        }));
+      });
+    }).then(function (docs) {
+      if (current !== pending) return;  // 더 최근 검색이 진행 중
+      docs = docs.filter(Boolean);
+      status.textContent = docs.length ? docs.length + "개의 기사" + (docs.length === MAX_RESULTS ? " (최신순 " + MAX_RESULTS + "개)" : "") : "검색 결과가 없습니다.";
+      render(docs);
+    }).catch(function (error) {
+      if (current === pending) status.textContent = error.message;
+    });
+  }
+
+  var timer;
+  input.addEventListener("input", function () {
+    clearTimeout(timer);
+    timer = setTimeout(function () { search(input.value); }, 150);
+  });
+
+  var initial = new URLSearchParams(location.search).get("q");
+  if (initial) {
+    input.value = initial;
+    search(initial);
+  }
+})();
@@ -0,0 +1,581 @@
+#!/usr/bin/env python3
+"""
+AI News Blog 자동화 공통 파이프라인
+Excel 파일 → Markdown 변환 → Git 업로드 단계와 명령행 처리를 한곳에 모아 두고,
+진입점(main_automation.py: Gmail SMTP, main_automation_oauth.py: Gmail OAuth)은 알림 발송 방법만 정의합니다.
+"""
+
+import os
+import sys
+import math
+import time
+from abc import ABC, abstractmethod
+from datetime import datetime
+import glob
+import importlib.util
+
+from ingest_manifest import IngestManifest, DEFAULT_MANIFEST_PATH
+from url_index import SeenUrlIndex, DEFAULT_INDEX_PATH
+from git_integration import GitRepository, GitError
+from notification_dispatcher import NotificationDispatcher
+from notification_digest import RecipientRateLimiter, DEFAULT_STATE_PATH
+from run_metrics import RunMetrics, DEFAULT_REPORT_PATH
+from input_readers import STDIN, collect_inputs, input_name, input_patterns
+from site_pages import update_site_pages, load_site_config, DEFAULT_SITE_INDEX_PATH, OUTPUT_PATHSPECS as SITE_PATHSPECS
+from search_index import (
+    update_search_index, DEFAULT_STATE_PATH as DEFAULT_SEARCH_STATE_PATH, OUTPUT_PATHSPECS as SEARCH_PATHSPECS
+)
+
+class AutomationPipeline(ABC):
+    """변환·업로드 파이프라인 (알림은 하위 클래스가 notifier와 send_milestone·send_blog_update로 발송)"""
+    
+    # 전체 자동화 시작 메시지에 붙일 이름
+    EDITION = ""
+    
+    def __init__(self, project_root=None):
+        # project_root를 지정하면 다른 디렉토리(벤치마크용 임시 저장소 등)를 대상으로 실행
+        self.project_root = project_root or os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        self.manifest_path = os.path.join(self.project_root, DEFAULT_MANIFEST_PATH)
+        self.url_index_path = os.path.join(self.project_root, DEFAULT_INDEX_PATH)
+        self.site_index_path = os.path.join(self.project_root, DEFAULT_SITE_INDEX_PATH)
+        self.search_state_path = os.path.join(self.project_root, DEFAULT_SEARCH_STATE_PATH)
+        self.posts_dir = os.path.join(self.project_root, "_posts")
+        self.git = GitRepository(self.project_root)
+        self.last_commit_sha = None
+        
+        # 단계별 실행 지표 (종료 시 .automation/run_report.json에 저장, prometheus_path를 지정하면 Prometheus 텍스트도 저장)
+        self.metrics = RunMetrics()
+        self.report_path = os.path.join(self.project_root, DEFAULT_REPORT_PATH)
+        self.prometheus_path = None
+        self.notifier = None
+        
+        # 알림은 백그라운드에서 발송 (파이프라인이 메일 서버 응답을 기다리지 않음)
+        self.dispatcher = NotificationDispatcher(metrics=self.metrics)
+        self.notification_timeout = 30
+    
+    def enable_digest(self, config):
+        """요약 모드: 실행당 한 통으로 묶어서 발송 (수신자별 최소 발송 간격은 실행 간에 유지)"""
+        if config.get("digest"):
+            self.notifier.enable_digest(RecipientRateLimiter(
+                os.path.join(self.project_root, DEFAULT_STATE_PATH),
+                config.get("min_interval_minutes", 0)
+            ))
+    
+    def notifier_available(self):
+        """알림을 보낼 수 있는지 확인"""
+        return self.notifier is not None
+    
+    @abstractmethod
+    def send_milestone(self, milestone, status, details):
+        """(디스패처 스레드) 마일스톤 알림 발송"""
+    
+    @abstractmethod
+    def send_blog_update(self, post_count, post_titles):
+        """(디스패처 스레드) 새 포스트 알림 발송"""
+    
+    def send_notification(self, milestone, status, details=""):
+        """이메일 알림 발송 (백그라운드 큐에 추가하고 바로 반환)"""
+        if self.notifier_available():
+            return self.dispatcher.submit(self.send_milestone, milestone, status, details)
+        else:
+            print(f"📧 알림: {milestone} - {status}")
+            if details:
+                print(f"   {details}")
+            return True
+    
+    def send_test_notification(self):
+        """test-email 명령의 테스트 알림"""
+        self.send_notification("테스트", "완료", "이메일 시스템 테스트입니다.")
+    
+    def close(self):
+        """실행 종료 시 요약 메일과 남은 알림을 제한 시간 안에 발송하고 알림 세션 정리"""
+        if self.notifier_available():
+            self.dispatcher.submit(self.notifier.flush_digest)
+            if hasattr(self.notifier, "close"):
+                self.dispatcher.submit(self.notifier.close)
+        self.dispatcher.shutdown(self.notification_timeout)
+        self.write_run_report()
+    
+    def write_run_report(self):
+        """단계별 실행 지표를 JSON 리포트(와 Prometheus 텍스트)로 저장"""
+        try:
+            report = self.metrics.save(self.report_path, self.prometheus_path)
+            print(f"⏱️  실행 리포트: {os.path.relpath(self.report_path, self.project_root)} ({report['wall_seconds']:.2f}초)")
+        except OSError as e:
+            print(f"⚠️  실행 리포트 저장 실패: {e}")
+    
+    def process_excel_files(self, stream=False, workers=None, backfill=False, use_cache=True, inputs=None,
+                            mark_near_duplicates=False, rerender=False):
+        """Excel 파일들을 처리하여 Markdown으로 변환
+
+        inputs(경로 목록)가 없으면 프로젝트 루트의 *.xlsx·*.csv·*.jsonl·*.ndjson·*.parquet를 변환합니다.
+        '-'는 표준 입력에서 JSON Lines를 읽으며, 매니페스트 없이 URL 인덱스로만 중복을 거릅니다.
+
+        stream=True면 한 행씩 읽어서 변환하고, workers가 주어지면 모든 워크북·시트를 프로세스 풀에서 병렬 변환합니다.
+        backfill=True면 워크북마다 파일명(또는 발행일 열)의 날짜를 포스트 날짜로 쓰고, 날짜 파티션을 병렬로 변환합니다.
+        use_cache=True면 파싱한 워크북을 .automation/workbook_cache에 캐시합니다 (pyarrow가 설치된 경우).
+        mark_near_duplicates=True면 원문 링크가 달라도 이미 게시한 기사와 제목·본문이 비슷한 기사(같은 소식)에 그 소식의 첫 포스트를 기록합니다.
+        rerender=True면 매니페스트와 관계없이 모든 입력을 (캐시를 거쳐) 다시 읽어 이미 게시한 포스트만 현재 템플릿으로 다시 씁니다.
+        """
+        # pandas·openpyxl·pyarrow는 import 비용이 커서 변환할 때만 불러옴
+        from excel_to_markdown import (
+            excel_to_markdown, convert_workbooks_parallel, rerender_posts, workbook_date, FilenameAllocator
+        )
+        from workbook_cache import WorkbookCache, DEFAULT_CACHE_DIR
+        from near_duplicates import NearDuplicateIndex, invalidate, DEFAULT_INDEX_PATH as DEFAULT_NEAR_DUPLICATE_PATH
+        
+        self.send_notification("데이터 처리", "시작", "Excel 파일을 Markdown으로 변환 중...")
+        
+        # 입력 파일 찾기 (Excel·CSV·JSON Lines·Parquet)
+        excel_files = collect_inputs(inputs or [self.project_root])
+        
+        if not excel_files:
+            self.send_notification("데이터 처리", "실패", "Excel 파일을 찾을 수 없습니다.")
+            return False, []
+        
+        # 템플릿 변경 후 재생성: 매니페스트를 거치지 않고 모든 입력을 다시 읽음 (한 번 파싱한 워크북은 캐시에서 읽음)
+        if rerender:
+            cache = WorkbookCache.open(os.path.join(self.project_root, DEFAULT_CACHE_DIR)) if use_cache else None
+            rewritten = rerender_posts(
+                [f for f in excel_files if f != STDIN], self.posts_dir, cache=cache, metrics=self.metrics
+            )
+            if cache and (cache.hits or cache.misses):
+                print(f"🗃️  워크북 캐시: {cache.hits}개 시트 재사용, {cache.misses}개 시트 파싱")
+            if rewritten:
+                invalidate(os.path.join(self.project_root, DEFAULT_NEAR_DUPLICATE_PATH))
+            self.send_notification("데이터 처리", "완료", f"{len(rewritten)}개의 포스트를 현재 템플릿으로 다시 생성했습니다.")
+            return True, rewritten
+        
+        # 이미 변환한 워크북은 건너뛰기
+        manifest = IngestManifest(self.manifest_path)
+        pending_files = [f for f in excel_files if f == STDIN or not manifest.is_unchanged(f)]
+        skipped = len(excel_files) - len(pending_files)
+        if skipped:
+            print(f"⏭️  변경되지 않은 Excel 파일 {skipped}개 건너뜀")
+        
+        if not pending_files:
+            self.send_notification("데이터 처리", "완료", "새로 변환할 Excel 파일이 없습니다.")
+            return True, []
+        
+        # 이미 게시한 기사 URL 인덱스 (없으면 _posts에서 재구축)
+        with self.metrics.stage("state_load"):
+            url_index = SeenUrlIndex.load(self.url_index_path, posts_dir=self.posts_dir)
+            # 게시한 기사 제목·본문의 MinHash 인덱스 (없으면 _posts에서 재구축)
+            near_duplicates = NearDuplicateIndex.load(
+                os.path.join(self.project_root, DEFAULT_NEAR_DUPLICATE_PATH), posts_dir=self.posts_dir
+            ) if mark_near_duplicates else None
+        
+        all_created_files = []
+        
+        # 파싱한 워크북 캐시 (스트리밍 변환은 메모리 사용량을 일정하게 유지하기 위해 캐시하지 않음)
+        cache = WorkbookCache.open(os.path.join(self.project_root, DEFAULT_CACHE_DIR)) if use_cache and not stream else None
+        
+        if STDIN in pending_files and (backfill or workers):
+            # 표준 입력은 한 번만 읽을 수 있으므로 프로세스 풀에 나누지 않음
+            print("ℹ️  표준 입력은 순차 변환합니다 (--parallel·--backfill 무시)")
+            backfill, workers = False, None
+        
+        if backfill:
+            # 날짜 파티션: 파일명이 날짜로 시작하므로 파티션끼리 파일명이 겹치지 않음
+            post_dates = {f: workbook_date(f) for f in pending_files}
+            partitions = sorted({date.strftime('%Y-%m-%d') for date in post_dates.values()})
+            workers = workers or os.cpu_count() or 1
+            print(f"📊 Processing {len(pending_files)} files in {len(partitions)} date partitions "
+                  f"({partitions[0]} ~ {partitions[-1]}) with {workers} workers")
+            all_created_files = convert_workbooks_parallel(
+                pending_files, self.posts_dir, manifest=manifest, url_index=url_index, workers=workers,
+                post_dates=post_dates, metrics=self.metrics, cache=cache, near_duplicates=near_duplicates
+            )
+        elif workers:
+            print(f"📊 Processing {len(pending_files)} files with {workers} workers")
+            all_created_files = convert_workbooks_parallel(
+                pending_files, self.posts_dir, manifest=manifest, url_index=url_index, workers=workers,
+                metrics=self.metrics, cache=cache, near_duplicates=near_duplicates
+            )
+        else:
+            # _posts 목록은 실행당 한 번만 읽음
+            allocator = FilenameAllocator(self.posts_dir)
+            for excel_file in pending_files:
+                print(f"📊 Processing: {input_name(excel_file)}")
+                
+                # Excel을 Markdown으로 변환 (표준 입력은 다시 읽을 수 없으므로 매니페스트에 기록하지 않음)
+                created_files = excel_to_markdown(
+                    excel_file, self.posts_dir, manifest=None if excel_file == STDIN else manifest, url_index=url_index, stream=stream, allocator=allocator,
+                    metrics=self.metrics, cache=cache, near_duplicates=near_duplicates
+                )
+                all_created_files.extend(created_files)
+        
+        if cache and (cache.hits or cache.misses):
+            print(f"🗃️  워크북 캐시: {cache.hits}개 시트 재사용, {cache.misses}개 시트 파싱")
+        
+        with self.metrics.stage("state_save"):
+            manifest.save()
+            url_index.save()
+            if near_duplicates is not None:
+                near_duplicates.save()
+            elif all_created_files:
+                invalidate(os.path.join(self.project_root, DEFAULT_NEAR_DUPLICATE_PATH))
+        
+        if all_created_files:
+            details = f"성공적으로 {len(all_created_files)}개의 블로그 포스트를 생성했습니다."
+            self.send_notification("데이터 처리", "완료", details)
+            return True, all_created_files
+        elif all(manifest.is_unchanged(f) for f in pending_files if f != STDIN):
+            # 모든 워크북을 정상 처리했지만 새 기사가 없는 경우
+            self.send_notification("데이터 처리", "완료", "새로 생성할 포스트가 없습니다. (중복 기사 제외)")
+            return True, []
+        else:
+            self.send_notification("데이터 처리", "실패", "Markdown 파일 생성에 실패했습니다.")
+            return False, []
+    
+    def update_site_pages(self, rebuild=False):
+        """목록(/page/N/)·월별 아카이브·사이트맵 중 포스트 변경으로 내용이 바뀐 페이지만 다시 생성 → (바뀐 파일, 지운 파일)"""
+        try:
+            with self.metrics.stage("site_pages"):
+                changed = update_site_pages(self.project_root, self.posts_dir, self.site_index_path, rebuild=rebuild)
+        except (OSError, ValueError) as e:
+            print(f"⚠️  목록 페이지 생성 실패: {e}")
+            return [], []
+        
+        written = [path for path in changed if os.path.exists(path)]
+        removed = [path for path in changed if not os.path.exists(path)]
+        if changed:
+            print(f"📄 목록·아카이브 페이지 {len(written)}개 갱신" + (f", {len(removed)}개 삭제" if removed else ""))
+        return written, removed
+    
+    def update_search_index(self, rebuild=False):
+        """새 포스트의 단어가 속한 검색 색인 샤드만 갱신 → (바뀐 파일, 지운 파일)"""
+        try:
+            with self.metrics.stage("search_index"):
+                _, baseurl = load_site_config(self.project_root)
+                changed = update_search_index(
+                    self.project_root, self.posts_dir, self.search_state_path, baseurl, rebuild=rebuild
+                )
+        except (OSError, ValueError) as e:
+            print(f"⚠️  검색 색인 갱신 실패: {e}")
+            return [], []
+        
+        changed = list(dict.fromkeys(changed))
+        return [path for path in changed if os.path.exists(path)], [path for path in changed if not os.path.exists(path)]
+    
+    def commit_and_push_changes(self, created_files):
+        """새 포스트와 생성 페이지만 Git에 커밋하고 푸시 (커밋 SHA는 self.last_commit_sha에 기록)"""
+        self.send_notification("Git 업로드", "시작", "변경사항을 GitHub에 업로드 중...")
+        
+        try:
+            # 새 포스트에 맞춰 바뀐 목록·아카이브 페이지와 검색 색인
+            self.update_site_pages()
+            self.update_search_index()
+            
+            # 새 포스트와 생성 페이지만 스테이징 (작업 트리 전체를 스캔하지 않음)
+            # 생성 페이지는 pathspec으로 찾으므로 `pages`·`search-index` 명령으로 미리 만든 파일도 함께 커밋됨
+            # .automation/의 변환 상태는 커밋하지 않음 (없으면 _posts와 생성 파일에서 다시 만듦)
+            with self.metrics.stage("git_add"):
+                staged = self.git.stage(list(created_files))
+                staged += self.git.stage_changes(SITE_PATHSPECS + SEARCH_PATHSPECS)
+            print(f"📝 {staged}개 파일 스테이징")
+            
+            # Git commit
+            commit_message = f"Add {len(created_files)} new AI news posts - {datetime.now().strftime('%Y-%m-%d %H:%M')}"
+            with self.metrics.stage("git_commit"):
+                self.last_commit_sha = self.git.commit(commit_message)
+            if self.last_commit_sha:
+                print(f"✅ 커밋 생성: {self.last_commit_sha[:12]}")
+            else:
+                print("ℹ️  커밋할 변경사항이 없습니다")
+            
+            # Git push
+            with self.metrics.stage("git_push"):
+                self.git.push("origin", "master")
+            
+            details = f"성공적으로 {len(created_files)}개의 포스트를 GitHub에 업로드했습니다."
+            if self.last_commit_sha:
+                details += f" (커밋 {self.last_commit_sha[:12]})"
+            self.send_notification("Git 업로드", "완료", details)
+            return True
+            
+        except GitError as e:
+            self.send_notification("Git 업로드", "실패", f"Git 명령 실패: {e}")
+            return False
+        except Exception as e:
+            self.send_notification("Git 업로드", "실패", f"예외 발생: {str(e)}")
+            return False
+    
+    def send_blog_update_notification(self, created_files):
+        """블로그 업데이트 알림 발송"""
+        if self.notifier_available() and created_files:
+            # 파일명에서 제목 추출
+            post_titles = []
+            for file_path in created_files:
+                filename = os.path.basename(file_path)
+                # 날짜 부분 제거하고 제목 추출
+                title_part = filename.replace('.md', '').split('-', 3)
+                if len(title_part) > 3:
+                    title = title_part[3].replace('-', ' ').title()
+                    post_titles.append(title)
+            
+            self.dispatcher.submit(self.send_blog_update, len(created_files), post_titles)
+    
+    def backfill_history(self, paths=None, mark_near_duplicates=False):
+        """과거 워크북을 크롤링 날짜별 커밋으로 가져오기 (git fast-import, 작업 트리에는 최종 결과만 반영)
+
+        mark_near_duplicates=True면 링크만 다른 같은 소식의 기사에 가장 이른 날짜의 포스트를 기록합니다.
+        """
+        # pandas·openpyxl은 import 비용이 커서 변환할 때만 불러옴
+        from backfill import backfill
+        from near_duplicates import NearDuplicateIndex, invalidate, DEFAULT_INDEX_PATH as DEFAULT_NEAR_DUPLICATE_PATH
+        
+        # 표준 입력은 크롤링 날짜를 알 수 없으므로 제외
+        excel_files = [f for f in collect_inputs(paths or [self.project_root]) if f != STDIN]
+        if not excel_files:
+            print("❌ 가져올 Excel 파일을 찾을 수 없습니다.")
+            return False
+        
+        manifest = IngestManifest(self.manifest_path)
+        excel_files = [f for f in excel_files if not manifest.is_unchanged(f)]
+        url_index = SeenUrlIndex.load(self.url_index_path, posts_dir=self.posts_dir)
+        near_duplicates = NearDuplicateIndex.load(
+            os.path.join(self.project_root, DEFAULT_NEAR_DUPLICATE_PATH), posts_dir=self.posts_dir
+        ) if mark_near_duplicates else None
+        
+        self.send_notification("과거 데이터 가져오기", "시작", f"{len(excel_files)}개 워크북을 날짜별 커밋으로 가져오는 중...")
+        try:
+            started = time.perf_counter()
+            commits, posts, sha = backfill(
+                self.git, excel_files, self.posts_dir, manifest, url_index, near_duplicates=near_duplicates
+            )
+            self.metrics.record("backfill", time.perf_counter() - started, rows=posts)
+        except Exception as e:
+            self.send_notification("과거 데이터 가져오기", "실패", f"예외 발생: {str(e)}")
+            return False
+        
+        manifest.save()
+        url_index.save()
+        if near_duplicates is not None:
+            near_duplicates.save()
+        elif posts:
+            invalidate(os.path.join(self.project_root, DEFAULT_NEAR_DUPLICATE_PATH))
+        self.last_commit_sha = sha
+        
+        details = f"{commits}개 커밋으로 {len(excel_files)}개 워크북에서 {posts}개의 포스트를 가져왔습니다."
+        if commits:
+            details += f" (HEAD {sha[:12]})"
+        self.send_notification("과거 데이터 가져오기", "완료", details)
+        return True
+    
+    def publish_new_posts(self):
+        """증분 파이프라인 한 번 실행 (새 포스트가 있으면 커밋·푸시 후 알림)"""
+        try:
+            success, created_files = self.process_excel_files()
+            if success and created_files and self.commit_and_push_changes(created_files):
+                self.send_blog_update_notification(created_files)
+        except Exception as e:
+            self.send_notification("자동화 시스템", "실패", f"예외 발생: {str(e)}")
+        
+        # 요약 모드에서는 처리한 워크북마다 요약 메일 발송 (데몬이 끝날 때까지 모아 두지 않음)
+        if self.notifier_available() and self.notifier.digest is not None:
+            self.dispatcher.submit(self.notifier.flush_digest)
+    
+    def watch(self, debounce=0.5):
+        """데몬 모드: 프로젝트 루트에 새로 생기거나 바뀐 워크북을 감지할 때마다 증분 파이프라인 실행 (Ctrl+C로 종료)"""
+        # 변환에 필요한 라이브러리가 없으면 워크북이 도착한 뒤가 아니라 감시 시작 전에 중단
+        missing = [name for name in ("pandas", "openpyxl") if importlib.util.find_spec(name) is None]
+        if missing:
+            print(f"❌ 워크북 변환에 필요한 라이브러리가 없습니다: {', '.join(missing)}")
+            print("다음 명령어로 설치하세요: pip install -r requirements.txt")
+            return False
+        from workbook_watcher import WorkbookWatcher, install_stop_handler
+        
+        install_stop_handler()
+        print(f"👀 새 워크북 감시 시작: {self.project_root}")
+        with WorkbookWatcher(self.project_root, patterns=input_patterns(), debounce=debounce) as watcher:
+            # 감시 시작 전에 도착한 워크북 처리
+            self.publish_new_posts()
+            try:
+                while True:
+                    ready = watcher.poll()
+                    if ready:
+                        print(f"📥 새 워크북: {', '.join(os.path.basename(f) for f in ready)}")
+                        self.publish_new_posts()
+                        self.write_run_report()
+            except KeyboardInterrupt:
+                print("👋 감시를 종료합니다.")
+        return True
+    
+    def check_ready(self):
+        """전체 자동화를 시작하기 전 확인 (알림 인증 등)"""
+        return True
+    
+    def run_full_automation(self):
+        """전체 자동화 프로세스 실행"""
+        print(f"🚀 AI News Blog 자동화 시작!{self.EDITION}")
+        self.send_notification("자동화 시스템", "시작", "전체 자동화 프로세스를 시작합니다.")
+        if not self.check_ready():
+            return False
+        
+        # 1. Excel 파일 처리
+        success, created_files = self.process_excel_files()
+        if not success:
+            return False
+        
+        if not created_files:
+            self.send_notification("자동화 시스템", "완료", "새로 생성할 포스트가 없습니다.")
+            return True
+        
+        # 2. Git 업로드
+        success = self.commit_and_push_changes(created_files)
+        if not success:
+            return False
+        
+        # 3. 블로그 업데이트 알림
+        self.send_blog_update_notification(created_files)
+        
+        # 4. 완료 알림
+        details = f"""
+전체 자동화 프로세스가 완료되었습니다! 🎉
+
+📊 처리된 포스트: {len(created_files)}개
+🌐 블로그 주소: https://winterkim-bot.github.io/sans
+🔗 GitHub 저장소: https://github.com/winterkim-bot/sans
+
+약 5-10분 후 GitHub Pages에서 업데이트된 블로그를 확인할 수 있습니다.
+        """
+        
+        self.send_notification("자동화 시스템", "완료", details.strip())
+        print("✅ 자동화 완료!")
+        return True
+
+def usage(program, extra_commands=None):
+    """사용법 문자열 (extra_commands: 진입점 전용 하위 명령)"""
+    commands = [
+        "process [--stream|--parallel[=N]|--backfill|--no-cache|--mark-near-duplicates|--rerender] [입력 파일 ...|-]",
+        "pages [--rebuild]",
+        "search-index [--rebuild]",
+        "push",
+        "watch [--debounce=초]",
+        "backfill [--mark-near-duplicates] [입력 파일 또는 디렉토리 ...]",
+        "test-email",
+    ] + list(extra_commands or {})
+    return f"사용법: python {program} [{'|'.join(commands)}]"
+
+def parse_workers(options):
+    """--parallel[=N] 옵션에서 워커 수 추출 (옵션이 없으면 None, 정수가 아니면 ValueError)"""
+    for option in options:
+        if option == "--parallel":
+            return os.cpu_count() or 1
+        if option.startswith("--parallel="):
+            value = option.split("=", 1)[1]
+            try:
+                return max(1, int(value))
+            except ValueError:
+                raise ValueError(f"--parallel 값은 정수여야 합니다: {value}") from None
+    return None
+
+def parse_debounce(options, default=0.5):
+    """--debounce=초 옵션에서 대기 시간 추출 (0 이상의 유한한 숫자가 아니면 ValueError)"""
+    for option in options:
+        if option.startswith("--debounce="):
+            value = option.split("=", 1)[1]
+            try:
+                debounce = float(value)
+            except ValueError:
+                debounce = None
+            if debounce is None or not math.isfinite(debounce) or debounce < 0:
+                raise ValueError(f"--debounce 값은 0 이상의 초 단위 숫자여야 합니다: {value}")
+            return debounce
+    return default
+
+def main(automation_class, program, extra_commands=None):
+    """진입점 공통 main (extra_commands: {명령: 함수(automation, 옵션 목록)})"""
+    # --prometheus=경로: 실행 지표를 Prometheus 텍스트로도 저장 (다른 인자보다 먼저 분리)
+    prometheus_path = next((arg.split("=", 1)[1] for arg in sys.argv[1:] if arg.startswith("--prometheus=")), None)
+    sys.argv = [arg for arg in sys.argv if not arg.startswith("--prometheus=")]
+    
+    automation = automation_class()
+    automation.prometheus_path = prometheus_path
+    try:
+        run_command(automation, program, extra_commands)
+    finally:
+        automation.close()
+
+def run_command(automation, program, extra_commands=None):
+    """명령행 인자에 따라 하위 명령 실행"""
+    extra_commands = extra_commands or {}
+    if len(sys.argv) > 1:
+        command = sys.argv[1]
+        
+        if command == "process":
+            # Excel 파일만 처리 (--stream: 대용량 워크북을 한 행씩 변환, --parallel[=N]: 프로세스 풀 병렬 변환,
+            # --backfill: 워크북 날짜로 포스트 날짜를 정해 날짜 파티션별 병렬 변환, --no-cache: 워크북 캐시 사용 안 함,
+            # --mark-near-duplicates: 링크만 다른 같은 소식의 기사에 먼저 게시한 포스트를 near_duplicate_of로 기록,
+            # --rerender: 이미 게시한 포스트를 워크북 캐시에서 다시 읽어 현재 템플릿으로 다시 생성)
+            # 옵션이 아닌 인자는 입력 파일·디렉토리 ('-'는 표준 입력의 JSON Lines)
+            options = sys.argv[2:]
+            inputs = [arg for arg in options if arg == STDIN or not arg.startswith("--")]
+            try:
+                workers = parse_workers(options)
+            except ValueError as e:
+                print(f"❌ {e}")
+                print(usage(program, extra_commands))
+                return
+            success, files = automation.process_excel_files(
+                stream="--stream" in options, workers=workers, backfill="--backfill" in options,
+                use_cache="--no-cache" not in options, inputs=inputs,
+                mark_near_duplicates="--mark-near-duplicates" in options, rerender="--rerender" in options
+            )
+            if success:
+                print(f"✅ {len(files)}개 파일 생성 완료")
+            else:
+                print("❌ 파일 처리 실패")
+                
+        elif command == "pages":
+            # 목록·월별 아카이브·사이트맵만 갱신 (--rebuild: 기록한 구성 해시를 무시하고 모든 페이지 확인)
+            automation.update_site_pages(rebuild="--rebuild" in sys.argv[2:])
+            
+        elif command == "search-index":
+            # 검색 색인만 갱신 (--rebuild: 처음부터 다시 생성)
+            automation.update_search_index(rebuild="--rebuild" in sys.argv[2:])
+            
+        elif command == "push":
+            # Git 푸시만 실행
+            files = glob.glob(os.path.join(automation.posts_dir, "*.md"))
+            success = automation.commit_and_push_changes(files)
+            if success:
+                print("✅ Git 푸시 완료")
+            else:
+                print("❌ Git 푸시 실패")
+                
+        elif command == "backfill":
+            # 과거 워크북을 크롤링 날짜별 커밋으로 일괄 가져오기 (인자가 없으면 프로젝트 루트의 *.xlsx)
+            options = sys.argv[2:]
+            success = automation.backfill_history(
+                [arg for arg in options if not arg.startswith("--")],
+                mark_near_duplicates="--mark-near-duplicates" in options
+            )
+            if success:
+                print(f"✅ 가져오기 완료 (원격 저장소에 올리려면: python {program} push)")
+            else:
+                print("❌ 가져오기 실패")
+                
+        elif command == "watch":
+            # 데몬 모드: 새 워크북을 감시하며 변환·업로드 (--debounce=초: 쓰기 완료로 볼 대기 시간)
+            try:
+                debounce = parse_debounce(sys.argv[2:])
+            except ValueError as e:
+                print(f"❌ {e}")
+                print(usage(program, extra_commands))
+                return
+            automation.watch(debounce)
+            
+        elif command == "test-email":
+            # 이메일 테스트
+            automation.send_test_notification()
+            
+        elif command in extra_commands:
+            extra_commands[command](automation, sys.argv[2:])
+            
+        else:
+            print(usage(program, extra_commands))
+    else:
+        # 전체 자동화 실행
+        automation.run_full_automation()
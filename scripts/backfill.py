@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+과거 크롤링 워크북 일괄 가져오기 (backfill)
+워크북을 크롤링 날짜별로 묶어 날짜마다 커밋 하나를 git fast-import로 직접 기록합니다.
+중간 상태를 작업 트리나 인덱스에 쓰지 않으므로 수만 개의 포스트도 git 프로세스 몇 개로 가져옵니다.
+"""
+
+import os
+from itertools import chain, groupby
+
+from excel_to_markdown import iter_post_records, render_post, workbook_date, FilenameAllocator
+from git_integration import FastImportStream
+from near_duplicates import minhash, post_name
+from url_index import url_key
+
+def group_by_crawl_date(excel_files):
+    """[(크롤링 날짜, [워크북, ...]), ...] (날짜 오름차순)"""
+    dated = sorted((workbook_date(excel_file), excel_file) for excel_file in excel_files)
+    return [(date, [excel_file for _, excel_file in group]) for date, group in groupby(dated, key=lambda item: item[0])]
+
+class BackfillDay:
+    """크롤링 날짜 하나의 포스트를 렌더링 (중복 제거·파일명 결정은 실행 전체에서 공유)"""
+
+    def __init__(self, date, allocator, manifest=None, url_index=None, url_keys=None, near_duplicates=None):
+        self.date_str = date.strftime('%Y-%m-%d')
+        self.post_date = date.strftime('%Y-%m-%d %H:%M:%S +0900')
+        self.allocator = allocator
+        self.manifest = manifest
+        self.url_index = url_index
+        self.url_keys = set() if url_keys is None else url_keys
+        self.near_duplicates = near_duplicates
+        self.converted = []
+        self.source_urls = []
+
+    def iter_posts(self, excel_files, repository_root):
+        """(저장소 기준 경로, 포스트 내용)을 하나씩 생성"""
+        for excel_file in excel_files:
+            seen_rows = self.manifest.seen_rows(excel_file) if self.manifest else set()
+            fingerprints = []
+
+            for title, clean_title, source_url, body, fingerprint in iter_post_records(
+                    excel_file, stream=True, with_fingerprints=self.manifest is not None):
+                if fingerprint in seen_rows:
+                    continue
+                fingerprints.append(fingerprint)
+
+                key = url_key(source_url) if source_url and self.url_index is not None else None
+                if key is not None and (key in self.url_keys or source_url in self.url_index):
+                    continue
+
+                if key is not None:
+                    self.url_keys.add(key)
+                    self.source_urls.append(source_url)
+
+                filepath = self.allocator.allocate(self.date_str, clean_title)
+
+                # 같은 소식을 다룬 다른 기사는 가장 이른 날짜의 포스트를 표시 (excel_to_markdown과 같은 동작)
+                near_duplicate_of = None
+                if self.near_duplicates is not None:
+                    signature = minhash(title, body)
+                    near_duplicate_of = self.near_duplicates.story_of(signature)
+                    if signature is not None:
+                        self.near_duplicates.add(signature, near_duplicate_of or post_name(filepath))
+
+                yield os.path.relpath(filepath, repository_root), render_post(
+                    title, self.post_date, source_url, body, near_duplicate_of
+                )
+
+            self.converted.append((excel_file, fingerprints))
+
+    def mark_imported(self):
+        """커밋이 기록된 뒤 매니페스트·URL 인덱스 갱신"""
+        if self.manifest:
+            for excel_file, fingerprints in self.converted:
+                for fingerprint in fingerprints:
+                    self.manifest.mark_row(excel_file, fingerprint)
+                self.manifest.mark_workbook(excel_file)
+        if self.url_index is not None:
+            for source_url in self.source_urls:
+                self.url_index.add(source_url)
+
+def backfill(repository, excel_files, posts_dir, manifest=None, url_index=None, branch="master", near_duplicates=None):
+    """워크북들을 크롤링 날짜별 커밋으로 가져오기
+
+    near_duplicates(NearDuplicateIndex)가 주어지면 링크가 달라도 이미 가져온 기사와 같은 소식인 포스트에 near_duplicate_of를 기록합니다.
+
+    fast-import가 끝난 뒤 브랜치가 바뀐 만큼만 작업 트리에 반영하며, (커밋 수, 포스트 수, 새 HEAD SHA)를 반환합니다.
+    """
+    allocator = FilenameAllocator(posts_dir)
+    url_keys = set()  # 이번 실행에서 가져온 기사 (날짜가 달라도 같은 기사는 한 번만)
+    days = []
+    total_posts = 0
+
+    with FastImportStream(repository, branch) as stream:
+        old_commit = stream.parent
+        for date, day_files in group_by_crawl_date(excel_files):
+            day = BackfillDay(date, allocator, manifest, url_index, url_keys, near_duplicates)
+            message = f"Backfill AI news posts crawled on {day.date_str}\n\n" + "\n".join(
+                f"- {os.path.basename(excel_file)}" for excel_file in day_files
+            ) + "\n"
+            days.append(day)
+
+            # 새 포스트가 없는 날은 빈 커밋을 만들지 않음
+            posts = day.iter_posts(day_files, repository.root)
+            first = next(posts, None)
+            if first is None:
+                print(f"⏭️  {day.date_str}: 새 포스트 없음")
+                continue
+
+            count = stream.commit(message, chain([first], posts), date)
+            print(f"📦 {day.date_str}: {count}개 포스트 ({len(day_files)}개 워크북)")
+            total_posts += count
+
+    new_commit = repository.resolve(f"refs/heads/{branch}")
+
+    # 체크아웃한 브랜치면 작업 트리를 새 커밋에 맞춤 (가져온 포스트만 기록됨)
+    if new_commit != old_commit and repository.current_branch() == branch:
+        repository.update_worktree(old_commit, new_commit)
+
+    for day in days:
+        day.mark_imported()
+
+    return stream.commits, total_posts, new_commit
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+자동화 스크립트 시작 시간 회귀 검사
+`python -X importtime`으로 진입점 모듈을 import하여 소요 시간을 측정하고,
+pandas·openpyxl·PyYAML·Google API 같은 무거운 라이브러리가 시작 시점에 로드되지 않는지 확인합니다.
+"""
+
+import os
+import sys
+import subprocess
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# 시작 시간을 측정할 진입점 모듈
+ENTRY_POINTS = ("main_automation", "main_automation_oauth")
+
+# 진입점 import 시 로드되면 안 되는 최상위 패키지 (하위 명령에서만 필요)
+HEAVY_MODULES = ("pandas", "numpy", "openpyxl", "pyarrow", "yaml", "google", "googleapiclient", "google_auth_oauthlib")
+
+# 진입점 하나의 import 허용 시간 (밀리초)
+DEFAULT_MAX_MS = 200
+
+# 측정 반복 횟수 (디스크 캐시·스케줄링 잡음을 줄이기 위해 가장 빠른 값 사용)
+DEFAULT_REPEAT = 3
+
+def measure_import(module):
+    """-X importtime 출력에서 (누적 import 시간 ms, 로드된 모듈 이름 목록) 추출"""
+    code = f"import sys; sys.path.insert(0, {SCRIPTS_DIR!r}); import {module}"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True, text=True, cwd=SCRIPTS_DIR
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"{module} import 실패:\n{result.stderr}")
+
+    total_us = 0
+    imported = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if not cumulative.strip().isdigit():
+            continue  # 헤더 줄
+        imported.append(name.strip())
+        if name.strip() == module:
+            total_us = int(cumulative)
+
+    return total_us / 1000, imported
+
+def best_import(module, repeat=DEFAULT_REPEAT):
+    """repeat번 측정 중 가장 빠른 (import 시간 ms, 로드된 모듈 이름 목록)"""
+    return min((measure_import(module) for _ in range(repeat)), key=lambda result: result[0])
+
+def check_entry_point(module, max_ms=DEFAULT_MAX_MS):
+    """진입점 하나를 검사하여 문제 목록 반환 (비어 있으면 통과)"""
+    elapsed_ms, imported = best_import(module)
+    heavy = sorted({name.split(".")[0] for name in imported} & set(HEAVY_MODULES))
+
+    print(f"⏱️  {module}: {elapsed_ms:.1f}ms ({len(imported)}개 모듈)")
+
+    problems = []
+    if heavy:
+        problems.append(f"{module}: 시작 시점에 무거운 모듈 로드됨 ({', '.join(heavy)})")
+    if elapsed_ms > max_ms:
+        problems.append(f"{module}: import 시간 {elapsed_ms:.1f}ms가 허용치 {max_ms}ms를 초과")
+    return problems
+
+def main():
+    """모든 진입점 검사 (회귀가 있으면 종료 코드 1)"""
+    max_ms = DEFAULT_MAX_MS
+    for option in sys.argv[1:]:
+        if option.startswith("--max-ms="):
+            max_ms = float(option.split("=", 1)[1])
+
+    problems = []
+    for module in ENTRY_POINTS:
+        problems.extend(check_entry_point(module, max_ms))
+
+    if problems:
+        for problem in problems:
+            print(f"❌ {problem}")
+        sys.exit(1)
+    print("✅ 시작 시간 검사 통과")
+
+if __name__ == "__main__":
+    main()
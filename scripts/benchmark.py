@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+변환 파이프라인 벤치마크
+합성 크롤링 워크북(1천/10만/100만 행)으로 clean_filename, create_post_content, excel_to_markdown,
+process_excel_files와 진입점 import 시간을 측정하고, 저장해 둔 기준 결과와 비교해 성능 회귀를 찾습니다.
+벤치마크마다 별도 프로세스에서 실행하여 최대 메모리(peak RSS)를 따로 측정합니다.
+"""
+
+import os
+import sys
+import io
+import json
+import time
+import shutil
+import resource
+import tempfile
+import subprocess
+from contextlib import redirect_stdout
+from datetime import datetime
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(SCRIPTS_DIR)
+sys.path.insert(0, SCRIPTS_DIR)
+
+from synthetic_workbook import synthetic_rows, cached_workbook
+from bench_import_time import ENTRY_POINTS, HEAVY_MODULES, best_import
+
+# 워크북 크기
+SIZES = {"1k": 1_000, "100k": 100_000, "1m": 1_000_000}
+DEFAULT_SIZES = ("1k",)
+
+BENCHMARKS = ("clean_filename", "create_post_content", "excel_to_markdown", "process_excel_files")
+
+BENCH_DIR = os.path.join(PROJECT_ROOT, ".automation", "bench")
+DEFAULT_BASELINE_PATH = os.path.join(PROJECT_ROOT, ".automation", "benchmark_baseline.json")
+LATEST_RESULT_PATH = os.path.join(PROJECT_ROOT, ".automation", "benchmark_latest.json")
+
+# 기준 결과보다 이 비율 이상 느려지거나 메모리를 더 쓰면 회귀로 판단
+DEFAULT_TOLERANCE = 0.25
+
+def peak_rss_mb():
+    """현재 프로세스의 최대 RSS (MB)"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 바이트 단위
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+def bench_clean_filename(workbook, rows):
+    from excel_to_markdown import clean_filename
+
+    titles = [row[0] for row in synthetic_rows(rows)]
+    started = time.perf_counter()
+    for title in titles:
+        clean_filename(title)
+    return time.perf_counter() - started
+
+def bench_create_post_content(workbook, rows):
+    from excel_to_markdown import create_post_content
+
+    records = [{'제목': row[0], '링크': row[1], '내용': row[6]} for row in synthetic_rows(rows)]
+    started = time.perf_counter()
+    for record in records:
+        create_post_content(record, '2025-05-18 00:00:00 +0900')
+    return time.perf_counter() - started
+
+def bench_excel_to_markdown(workbook, rows):
+    from excel_to_markdown import excel_to_markdown
+
+    output_dir = tempfile.mkdtemp(prefix="bench-posts-")
+    try:
+        started = time.perf_counter()
+        excel_to_markdown(workbook, output_dir)
+        return time.perf_counter() - started
+    finally:
+        shutil.rmtree(output_dir, ignore_errors=True)
+
+def bench_process_excel_files(workbook, rows):
+    """임시 프로젝트 디렉토리에서 매니페스트·URL 인덱스·실행 리포트까지 포함한 전체 변환 단계"""
+    from main_automation import BlogAutomation
+
+    project_root = tempfile.mkdtemp(prefix="bench-project-")
+    try:
+        os.symlink(workbook, os.path.join(project_root, os.path.basename(workbook)))
+        automation = BlogAutomation(project_root)
+        automation.notifier = None  # 벤치마크 중에는 메일을 보내지 않음
+        started = time.perf_counter()
+        try:
+            automation.process_excel_files()
+        finally:
+            automation.close()
+        return time.perf_counter() - started
+    finally:
+        shutil.rmtree(project_root, ignore_errors=True)
+
+def run_one(name, rows, workbook, repeat):
+    """(자식 프로세스) 벤치마크 하나를 repeat번 실행하여 가장 빠른 시간과 최대 RSS 측정"""
+    bench = globals()[f"bench_{name}"]
+    timings = []
+    with redirect_stdout(io.StringIO()):
+        for _ in range(repeat):
+            timings.append(bench(workbook, rows))
+
+    seconds = min(timings)
+    return {
+        "seconds": round(seconds, 6),
+        "rows": rows,
+        "rows_per_sec": round(rows / seconds, 1) if seconds > 0 else None,
+        "peak_rss_mb": round(peak_rss_mb(), 1)
+    }
+
+def run_isolated(name, rows, workbook, repeat):
+    """벤치마크를 별도 프로세스에서 실행 (peak RSS가 다른 벤치마크의 영향을 받지 않도록)"""
+    result = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--run-one", name, str(rows), workbook, str(repeat)],
+        capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"{name} 벤치마크 실패:\n{result.stderr}")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+def run_import_benchmarks():
+    """진입점 import 시간 (여러 번 중 가장 빠른 값)과 시작 시점에 로드된 무거운 모듈"""
+    results = {}
+    for module in ENTRY_POINTS:
+        elapsed_ms, imported = best_import(module)
+        heavy = sorted({name.split(".")[0] for name in imported} & set(HEAVY_MODULES))
+        results[f"import:{module}"] = {"seconds": round(elapsed_ms / 1000, 6), "heavy_modules": heavy}
+        print(f"⏱️  {'import:' + module:32} {elapsed_ms / 1000:10.3f}초")
+    return results
+
+def run_suite(sizes, only=None, repeat=None):
+    """선택한 크기·벤치마크 실행 결과"""
+    results = run_import_benchmarks()
+    for size in sizes:
+        rows = SIZES[size]
+        workbook = cached_workbook(BENCH_DIR, rows)
+        for name in BENCHMARKS:
+            if only and name not in only:
+                continue
+            # 큰 워크북은 한 번만 실행
+            times = repeat or (3 if rows <= 10_000 else 1)
+            key = f"{name}@{size}"
+            results[key] = run_isolated(name, rows, workbook, times)
+            result = results[key]
+            print(f"⏱️  {key:32} {result['seconds']:10.3f}초 {result['rows_per_sec'] or 0:12.0f} rows/s "
+                  f"{result['peak_rss_mb']:8.1f} MB")
+    return {
+        "created_at": datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        "python": sys.version.split()[0],
+        "results": results
+    }
+
+def compare(current, baseline, tolerance=DEFAULT_TOLERANCE):
+    """기준 결과와 비교하여 회귀 목록 반환"""
+    regressions = []
+    for key, result in current["results"].items():
+        if result.get("heavy_modules"):
+            regressions.append(f"{key}: 시작 시점에 무거운 모듈 로드됨 ({', '.join(result['heavy_modules'])})")
+
+        base = baseline["results"].get(key)
+        if not base:
+            continue
+        for metric in ("seconds", "peak_rss_mb"):
+            if metric in result and base.get(metric) and result[metric] > base[metric] * (1 + tolerance):
+                regressions.append(
+                    f"{key}: {metric} {base[metric]} → {result[metric]} (+{(result[metric] / base[metric] - 1) * 100:.0f}%)"
+                )
+    return regressions
+
+def write_json(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=1)
+
+def option_value(options, name, default=None):
+    """--name=값 형태의 옵션 값 (값 없이 --name만 있으면 True)"""
+    for option in options:
+        if option == f"--{name}":
+            return True
+        if option.startswith(f"--{name}="):
+            return option.split("=", 1)[1]
+    return default
+
+def main():
+    """벤치마크 실행
+
+    사용법: python benchmark.py [--sizes=1k,100k,1m] [--only=excel_to_markdown,...] [--repeat=N]
+                                [--save[=기준파일]] [--compare[=기준파일]] [--tolerance=0.25]
+    """
+    options = sys.argv[1:]
+    if options[:1] == ["--run-one"]:
+        name, rows, workbook, repeat = options[1:5]
+        print(json.dumps(run_one(name, int(rows), workbook, int(repeat))))
+        return
+
+    sizes = option_value(options, "sizes", ",".join(DEFAULT_SIZES)).split(",")
+    unknown = [size for size in sizes if size not in SIZES]
+    if unknown:
+        print(f"❌ 알 수 없는 크기: {', '.join(unknown)} (사용 가능: {', '.join(SIZES)})")
+        sys.exit(1)
+    only = option_value(options, "only")
+    repeat = option_value(options, "repeat")
+    tolerance = float(option_value(options, "tolerance", DEFAULT_TOLERANCE))
+
+    current = run_suite(sizes, only.split(",") if only else None, int(repeat) if repeat else None)
+    write_json(LATEST_RESULT_PATH, current)
+
+    save = option_value(options, "save")
+    if save:
+        path = DEFAULT_BASELINE_PATH if save is True else save
+        write_json(path, current)
+        print(f"💾 기준 결과 저장: {path}")
+
+    compare_with = option_value(options, "compare")
+    if compare_with:
+        path = DEFAULT_BASELINE_PATH if compare_with is True else compare_with
+        if not os.path.exists(path):
+            print(f"❌ 기준 결과가 없습니다: {path} (먼저 --save로 저장하세요)")
+            sys.exit(1)
+        with open(path, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+
+        regressions = compare(current, baseline, tolerance)
+        if regressions:
+            for regression in regressions:
+                print(f"❌ {regression}")
+            sys.exit(1)
+        print(f"✅ 기준 결과 대비 회귀 없음 (허용치 {tolerance * 100:.0f}%)")
+
+if __name__ == "__main__":
+    main()
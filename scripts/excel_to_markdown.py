@@ -4,10 +4,21 @@ Excel 파일을 읽어서 Jekyll 블로그 포스트용 Markdown 파일로 변
 """
 
 import pandas as pd
+import openpyxl
 import os
-from datetime import datetime
+import time
+from datetime import datetime, timedelta, timezone
 import re
-import yaml
+from concurrent.futures import ProcessPoolExecutor
+from itertools import groupby
+
+from front_matter import dump_front_matter
+from input_readers import iter_input_rows, is_excel
+from ingest_manifest import row_fingerprint
+from near_duplicates import minhash, post_name
+from post_writer import PostWriter, write_file
+from site_pages import POST_FILENAME_PATTERN, read_post_meta
+from url_index import url_key
 
 def clean_filename(title):
     """제목을 파일명으로 사용할 수 있도록 정리"""
@@ -16,12 +27,92 @@ def clean_filename(title):
     cleaned = re.sub(r'[-\s]+', '-', cleaned)
     return cleaned.lower().strip('-')
 
-def create_post_content(row, date_str):
-    """블로그 포스트 내용 생성"""
+# 열 이름 매핑 (앞에 있는 열을 우선 사용)
+TITLE_COLUMNS = ('제목', 'title')
+URL_COLUMNS = ('링크', 'url')
+BODY_COLUMNS = ('내용', 'content', '요약')
+
+def get_source_url(row):
+    """행에서 원문 링크 추출 (없으면 None)"""
+    for column in URL_COLUMNS:
+        if column in row and pd.notna(row[column]):
+            return str(row[column])
+    return None
+
+def get_body(row):
+    """행에서 본문 추출 (없으면 None)"""
+    for column in BODY_COLUMNS:
+        if column in row and pd.notna(row[column]):
+            return row[column]
+    return None
+
+# 포스트 날짜의 시간대 (front matter의 '+0900')
+KST = timezone(timedelta(hours=9))
+
+# 게시 날짜로 쓸 수 있는 열과 워크북 파일명의 크롤링 날짜 (예: google_ai_news_20250518.xlsx)
+DATE_COLUMNS = ('발행일', 'date', '날짜')
+WORKBOOK_DATE_PATTERN = re.compile(r'(?<!\d)(20\d{2})(\d{2})(\d{2})(?!\d)')
+
+# 발행일 표기: '3시간 전', '2일 전' 같은 상대 표기와 '2025.05.16.' 같은 절대 표기
+RELATIVE_DATE_PATTERN = re.compile(r'^(\d+)\s*(분|시간|일|주|개월)\s*전$')
+ABSOLUTE_DATE_PATTERN = re.compile(r'(20\d{2})\s*[.\-/년]\s*(\d{1,2})\s*[.\-/월]\s*(\d{1,2})')
+RELATIVE_UNITS = {'분': timedelta(minutes=1), '시간': timedelta(hours=1), '일': timedelta(days=1),
+                  '주': timedelta(weeks=1), '개월': timedelta(days=30)}
+
+def parse_published_date(value, reference):
+    """발행일 값을 datetime으로 변환 (상대 표기는 reference 기준, 해석할 수 없으면 None)"""
+    if isinstance(value, datetime):
+        return value
+    if value is None or pd.isna(value):
+        return None
+    
+    text = str(value).strip()
+    match = RELATIVE_DATE_PATTERN.match(text)
+    if match:
+        return reference - int(match.group(1)) * RELATIVE_UNITS[match.group(2)]
+    
+    match = ABSOLUTE_DATE_PATTERN.search(text)
+    if match:
+        try:
+            return datetime(*map(int, match.groups()), tzinfo=KST)
+        except ValueError:
+            return None
+    return None
+
+def workbook_date(excel_file):
+    """워크북의 게시 날짜 (KST 자정)
+
+    파일명의 YYYYMMDD를 우선 사용하고, 없으면 발행일 열의 가장 최근 날짜(상대 표기는 파일 수정 시각 기준),
+    그것도 없으면 파일 수정 시각을 사용합니다. CSV·JSON Lines·Parquet 입력도 같은 규칙을 따릅니다.
+    """
+    match = WORKBOOK_DATE_PATTERN.search(os.path.basename(excel_file))
+    if match:
+        try:
+            return datetime(*map(int, match.groups()), tzinfo=KST)
+        except ValueError:
+            pass
+    
+    modified = datetime.fromtimestamp(os.path.getmtime(excel_file), KST)
+    published = None
+    try:
+        for row in iter_input_rows(excel_file):
+            value = next((row[column] for column in DATE_COLUMNS if column in row), None)
+            date = parse_published_date(value, modified)
+            if date is not None:
+                date = date if date.tzinfo else date.replace(tzinfo=KST)
+                published = date if published is None else max(published, date)
+    except Exception as e:
+        print(f"Error reading dates from Excel file: {e}")
+    
+    date = (published or modified).astimezone(KST)
+    return date.replace(hour=0, minute=0, second=0, microsecond=0)
+
+def render_post(title, date_str, source_url=None, body=None, near_duplicate_of=None):
+    """제목·날짜·링크·본문으로 포스트 Markdown 생성 (near_duplicate_of: 같은 소식을 처음 다룬 포스트 이름)"""
     # YAML front matter
     front_matter = {
         'layout': 'post',
-        'title': str(row.get('제목', row.get('title', 'AI News'))),
+        'title': title,
         'date': date_str,
         'categories': ['ai', 'news'],
         'tags': ['google', 'crawling', 'ai'],
@@ -29,85 +120,495 @@ def create_post_content(row, date_str):
     }
     
     # 링크가 있다면 추가
-    if '링크' in row and pd.notna(row['링크']):
-        front_matter['source_url'] = str(row['링크'])
-    elif 'url' in row and pd.notna(row['url']):
-        front_matter['source_url'] = str(row['url'])
+    if source_url is not None:
+        front_matter['source_url'] = source_url
+    if near_duplicate_of:
+        front_matter['near_duplicate_of'] = near_duplicate_of
     
-    # YAML 헤더 생성
-    yaml_header = yaml.dump(front_matter, default_flow_style=False, allow_unicode=True)
+    # YAML 헤더 생성 (고정 스키마 전용 직렬화, yaml.dump와 동일한 결과)
+    yaml_header = dump_front_matter(front_matter)
     
     # 본문 내용
     content = f"---\n{yaml_header}---\n\n"
     
     # 제목
-    content += f"# {front_matter['title']}\n\n"
+    content += f"# {title}\n\n"
     
     # 내용 추가
-    if '내용' in row and pd.notna(row['내용']):
-        content += f"{row['내용']}\n\n"
-    elif 'content' in row and pd.notna(row['content']):
-        content += f"{row['content']}\n\n"
-    elif '요약' in row and pd.notna(row['요약']):
-        content += f"{row['요약']}\n\n"
+    if body is not None:
+        content += f"{body}\n\n"
     
     # 원본 링크
-    if front_matter.get('source_url'):
-        content += f"[원문 보기]({front_matter['source_url']})\n\n"
+    if source_url:
+        content += f"[원문 보기]({source_url})\n\n"
     
     # 자동 생성 표시
     content += "---\n*이 포스트는 자동으로 생성되었습니다.*\n"
     
     return content
 
-def excel_to_markdown(excel_file, output_dir='_posts'):
-    """Excel 파일을 Markdown 포스트로 변환"""
+def create_post_content(row, date_str):
+    """블로그 포스트 내용 생성"""
+    title = str(row.get('제목', row.get('title', 'AI News')))
+    return render_post(title, date_str, get_source_url(row), get_body(row))
+
+def first_present(df, columns):
+    """여러 후보 열 중 행마다 처음으로 값이 있는 열을 선택 (열 단위 연산)"""
+    columns = [column for column in columns if column in df.columns]
+    if not columns:
+        return [None] * len(df)
+    
+    result = df[columns[0]].astype(object)
+    for column in columns[1:]:
+        result = result.where(result.notna(), df[column].astype(object))
+    return result.where(result.notna(), None).tolist()
+
+def extract_post_fields(df):
+    """워크북 전체의 제목·파일명·링크·본문을 열 단위로 한 번에 계산"""
+    title_column = next((column for column in TITLE_COLUMNS if column in df.columns), None)
+    
+    if title_column:
+        titles = [str(value) for value in df[title_column].tolist()]
+        filename_titles = titles
+        front_matter_titles = titles
+    else:
+        filename_titles = [f'AI News {index + 1}' for index in df.index]
+        front_matter_titles = ['AI News'] * len(df)
+    
+    # 파일명용 slug (clean_filename과 동일한 규칙을 열 전체에 적용)
+    slugs = (
+        pd.Series(filename_titles, dtype=object)
+        .str.replace(r'[^\w\s-]', '', regex=True)
+        .str.replace(r'[-\s]+', '-', regex=True)
+        .str.lower()
+        .str.strip('-')
+        .tolist()
+    )
+    
+    source_urls = [None if value is None else str(value) for value in first_present(df, URL_COLUMNS)]
+    bodies = first_present(df, BODY_COLUMNS)
+    
+    return zip(front_matter_titles, slugs, source_urls, bodies)
+
+def iter_excel_rows(excel_file):
+    """openpyxl 읽기 전용 모드로 첫 번째 시트의 행을 dict로 하나씩 반환 (메모리 사용량 일정)
+
+    pd.read_excel과 같은 결과가 나오도록 빈 셀은 NaN으로, 이름 없는 열은 'Unnamed: n'으로 채우고
+    시트 끝의 빈 행은 버립니다. 단, 빈 셀이 섞인 숫자 열은 pandas처럼 float로 바뀌지 않습니다 (483.0 대신 483).
+    행 해시는 ingest_manifest.cell_text가 두 표현을 같은 값으로 맞춥니다.
+    """
+    workbook = openpyxl.load_workbook(excel_file, read_only=True, data_only=True)
     try:
-        # Excel 파일 읽기
-        df = pd.read_excel(excel_file)
+        rows = workbook.worksheets[0].iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return
         
-        # 출력 디렉토리 생성
-        os.makedirs(output_dir, exist_ok=True)
-        
-        # 현재 날짜
-        current_date = datetime.now()
-        date_str = current_date.strftime('%Y-%m-%d')
-        
-        created_files = []
+        columns = [
+            f'Unnamed: {i}' if name is None else (name if isinstance(name, str) else str(name))
+            for i, name in enumerate(header)
+        ]
+        empty_row = dict.fromkeys(columns, float('nan'))
+        blank_rows = 0
         
-        for index, row in df.iterrows():
-            # 제목 추출
-            title = str(row.get('제목', row.get('title', f'AI News {index + 1}')))
+        for values in rows:
+            if all(value is None for value in values):
+                # 뒤에 데이터가 이어질 때만 빈 행으로 반환
+                blank_rows += 1
+                continue
             
-            # 파일명 생성
-            clean_title = clean_filename(title)
-            filename = f"{date_str}-{clean_title}.md"
-            filepath = os.path.join(output_dir, filename)
+            for _ in range(blank_rows):
+                yield dict(empty_row)
+            blank_rows = 0
             
-            # 중복 파일명 처리
-            counter = 1
-            original_filepath = filepath
-            while os.path.exists(filepath):
+            row = dict(empty_row)
+            for column, value in zip(columns, values):
+                if value is not None:
+                    row[column] = value
+            yield row
+    finally:
+        workbook.close()
+
+def stream_post_fields(rows):
+    """행 단위로 제목·파일명·링크·본문 계산 (스트리밍 경로)"""
+    for index, row in enumerate(rows):
+        title_value = row.get('제목', row.get('title'))
+        if title_value is None:
+            title, filename_title = 'AI News', f'AI News {index + 1}'
+        else:
+            title = filename_title = str(title_value)
+        
+        yield title, clean_filename(filename_title), get_source_url(row), get_body(row), row
+
+def iter_post_records(excel_file, stream=False, with_fingerprints=False, sheet_name=0, cache=None):
+    """(제목, slug, 링크, 본문, 행 해시) 레코드를 반환 (stream=True면 openpyxl로 한 행씩 읽음)
+
+    xlsx가 아닌 입력(CSV·JSON Lines·Parquet·표준 입력)은 항상 input_readers로 한 행씩 읽습니다.
+    cache(WorkbookCache)가 주어지면 파싱한 시트를 캐시에서 읽거나 캐시에 저장합니다 (stream=True일 때는 사용하지 않음).
+    """
+    if stream or not is_excel(excel_file):
+        for title, clean_title, source_url, body, row in stream_post_fields(iter_input_rows(excel_file)):
+            fingerprint = row_fingerprint(row.values()) if with_fingerprints else None
+            yield title, clean_title, source_url, body, fingerprint
+        return
+    
+    # Excel 파일 전체 읽기
+    if cache:
+        df = cache.read_excel(excel_file, sheet_name=sheet_name)
+    else:
+        df = pd.read_excel(excel_file, sheet_name=sheet_name)
+    fingerprints = (
+        [row_fingerprint(values) for values in df.astype(object).itertuples(index=False, name=None)]
+        if with_fingerprints else [None] * len(df)
+    )
+    for fields, fingerprint in zip(extract_post_fields(df), fingerprints):
+        yield fields + (fingerprint,)
+
+# 대부분의 파일시스템에서 파일명 길이 제한 (UTF-8 바이트 기준)
+MAX_FILENAME_BYTES = 255
+
+class FilenameAllocator:
+    """출력 디렉토리를 한 번만 읽고, 실행 동안 사용한 파일명과 slug별 다음 번호를 메모리에 유지"""
+    
+    def __init__(self, output_dir):
+        self.output_dir = output_dir
+        self.existing = set(os.listdir(output_dir)) if os.path.isdir(output_dir) else set()
+        self.next_counter = {}
+    
+    def fit_slug(self, date_str, clean_title):
+        """번호 접미사까지 붙여도 파일명 길이 제한을 넘지 않도록 slug를 바이트 단위로 자름"""
+        # "{date}-" + slug + "-{counter}" + ".md" (번호는 최대 6자리까지 여유)
+        limit = MAX_FILENAME_BYTES - len(f"{date_str}-".encode('utf-8')) - len("-999999.md")
+        encoded = clean_title.encode('utf-8')
+        if len(encoded) <= limit:
+            return clean_title
+        return encoded[:limit].decode('utf-8', errors='ignore').rstrip('-')
+    
+    def allocate(self, date_str, clean_title):
+        """사용하지 않은 포스트 파일 경로 결정 (같은 이름이 있으면 -1, -2 ... 를 붙임)"""
+        clean_title = self.fit_slug(date_str, clean_title)
+        key = (date_str, clean_title)
+        counter = self.next_counter.get(key, 0)
+        
+        while True:
+            if counter == 0:
+                filename = f"{date_str}-{clean_title}.md"
+            else:
                 filename = f"{date_str}-{clean_title}-{counter}.md"
-                filepath = os.path.join(output_dir, filename)
-                counter += 1
-            
-            # 포스트 내용 생성
-            post_content = create_post_content(row, current_date.strftime('%Y-%m-%d %H:%M:%S +0900'))
-            
-            # 파일 저장
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(post_content)
-            
-            created_files.append(filepath)
+            counter += 1
+            if filename not in self.existing:
+                break
+        
+        self.next_counter[key] = counter
+        self.existing.add(filename)
+        return os.path.join(self.output_dir, filename)
+
+class WorkbookBatch:
+    """워크북 하나에서 이번 실행에 저장할 포스트 (커밋이 끝난 뒤에만 매니페스트·URL 인덱스에 기록)"""
+    
+    def __init__(self, excel_file, output_dir, manifest=None, url_index=None, metrics=None, near_duplicates=None):
+        self.excel_file = excel_file
+        self.manifest = manifest
+        self.url_index = url_index
+        self.metrics = metrics
+        self.near_duplicates = near_duplicates
+        self.near_duplicate_count = len(near_duplicates) if near_duplicates is not None else 0
+        self.seen_rows = manifest.seen_rows(excel_file) if manifest else set()
+        self.fingerprints = set()
+        self.url_keys = set()
+        self.source_urls = []
+        self.writer = PostWriter(output_dir)
+    
+    def is_converted(self, fingerprint):
+        """이미 변환한 행인지 확인"""
+        return self.manifest is not None and (fingerprint in self.seen_rows or fingerprint in self.fingerprints)
+    
+    def is_duplicate(self, source_url):
+        """이미 게시했거나 이번 배치에 포함된 기사인지 확인"""
+        if self.url_index is None or not source_url:
+            return False
+        return url_key(source_url) in self.url_keys or source_url in self.url_index
+    
+    def near_duplicate_of(self, signature):
+        """이미 게시했거나 이번 실행에 포함된 기사와 같은 소식이면 그 소식의 첫 포스트 이름 (제목·본문 MinHash 유사도)"""
+        if self.near_duplicates is None:
+            return None
+        return self.near_duplicates.story_of(signature)
+    
+    def skip(self, fingerprint):
+        """중복으로 건너뛴 행도 변환한 것으로 기록"""
+        self.fingerprints.add(fingerprint)
+    
+    def add(self, filepath, post_content, source_url, fingerprint, signature=None, near_duplicate_of=None):
+        """포스트 저장 예약"""
+        self.writer.write(filepath, post_content)
+        self.fingerprints.add(fingerprint)
+        if self.near_duplicates is not None and signature is not None:
+            self.near_duplicates.add(signature, near_duplicate_of or post_name(filepath))
+        if source_url:
+            self.url_keys.add(url_key(source_url))
+            self.source_urls.append(source_url)
+    
+    def commit(self):
+        """staging에 쓴 포스트를 한꺼번에 옮기고 매니페스트·URL 인덱스 갱신"""
+        started = time.perf_counter()
+        created_files = self.writer.commit()
+        if self.metrics:
+            self.metrics.record("write", time.perf_counter() - started, rows=len(created_files),
+                                bytes=self.writer.bytes_written)
+        
+        for filepath in created_files:
             print(f"Created: {filepath}")
         
+        if self.manifest:
+            for fingerprint in self.fingerprints:
+                self.manifest.mark_row(self.excel_file, fingerprint)
+            self.manifest.mark_workbook(self.excel_file)
+        if self.url_index is not None:
+            for source_url in self.source_urls:
+                self.url_index.add(source_url)
+        
         return created_files
+    
+    def abort(self):
+        """배치 버리기 (이 배치에서 유사 중복 인덱스에 추가한 서명도 제거)"""
+        self.writer.abort()
+        if self.near_duplicates is not None:
+            self.near_duplicates.rollback(self.near_duplicate_count)
+
+def excel_to_markdown(excel_file, output_dir='_posts', manifest=None, url_index=None, stream=False,
+                      allocator=None, post_date=None, metrics=None, cache=None, near_duplicates=None):
+    """Excel 파일을 Markdown 포스트로 변환
+
+    manifest가 주어지면 이미 변환한 행을, url_index가 주어지면 이미 게시한 원문 링크를 건너뜁니다.
+    near_duplicates(NearDuplicateIndex)가 주어지면 링크가 달라도 이미 게시한 기사와 같은 소식인 포스트에 near_duplicate_of를 기록합니다.
+    stream=True면 워크북 전체를 DataFrame으로 읽지 않고 한 행씩 변환합니다.
+    CSV·JSON Lines·Parquet 파일이나 표준 입력('-')도 받으며, 이들은 항상 한 행씩 변환합니다.
+    여러 워크북을 연달아 변환할 때는 같은 allocator를 넘기면 출력 디렉토리를 한 번만 읽습니다.
+    post_date(datetime)가 주어지면 현재 시각 대신 포스트 날짜와 파일명에 사용합니다.
+    metrics(RunMetrics)가 주어지면 읽기(read_excel)·렌더링(render)·저장(write) 단계 지표를 기록합니다.
+    cache(WorkbookCache)가 주어지면 한 번 파싱한 워크북은 캐시에서 읽습니다.
+    포스트는 워크북 단위로 모두 저장되거나 하나도 저장되지 않습니다.
+    """
+    try:
+        records = iter_post_records(excel_file, stream=stream, with_fingerprints=manifest is not None, cache=cache)
+        render = render_post
+        if metrics:
+            records = metrics.timed_rows("read_excel", records)
+            render = metrics.timed_call("render", render_post, rows=1)
+        
+        # 출력 디렉토리 생성
+        os.makedirs(output_dir, exist_ok=True)
+        if allocator is None:
+            allocator = FilenameAllocator(output_dir)
+        
+        # 포스트 날짜 (지정하지 않으면 현재 날짜)
+        current_date = post_date or datetime.now()
+        date_str = current_date.strftime('%Y-%m-%d')
+        post_date = current_date.strftime('%Y-%m-%d %H:%M:%S +0900')
+        
+        batch = WorkbookBatch(excel_file, output_dir, manifest, url_index, metrics, near_duplicates)
+        try:
+            for title, clean_title, source_url, body, fingerprint in records:
+                # 이미 변환한 행 건너뛰기
+                if batch.is_converted(fingerprint):
+                    continue
+                
+                # 이미 게시한 기사 건너뛰기
+                if batch.is_duplicate(source_url):
+                    print(f"Skipped duplicate: {source_url}")
+                    batch.skip(fingerprint)
+                    continue
+                
+                # 같은 소식을 다룬 다른 기사는 게시하되 첫 포스트를 표시
+                signature = minhash(title, body) if near_duplicates is not None else None
+                near_duplicate_of = batch.near_duplicate_of(signature)
+                if near_duplicate_of:
+                    print(f"Near-duplicate of {near_duplicate_of}: {title}")
+                
+                # 파일명 생성 (중복 파일명 처리 포함)
+                filepath = allocator.allocate(date_str, clean_title)
+                
+                # 포스트 내용 생성 후 저장 예약 (백그라운드 스레드가 staging에 기록)
+                post_content = render(title, post_date, source_url, body, near_duplicate_of)
+                batch.add(filepath, post_content, source_url, fingerprint, signature, near_duplicate_of)
+            
+            return batch.commit()
+        except Exception:
+            batch.abort()
+            raise
         
     except Exception as e:
         print(f"Error processing Excel file: {e}")
         return []
 
+def render_sheet(task):
+    """프로세스 풀 작업: 시트 하나를 읽어 포스트 내용과 MinHash 서명까지 생성 (파일명은 코디네이터가 결정)
+
+    서명을 계산할 때는 같은 소식으로 판단되면 코디네이터가 다시 렌더링할 수 있도록 본문도 반환합니다.
+    """
+    excel_file, sheet_name, post_date, seen_rows, cache, with_signatures = task
+    rendered = []
+    
+    for title, clean_title, source_url, body, fingerprint in iter_post_records(
+            excel_file, with_fingerprints=True, sheet_name=sheet_name, cache=cache):
+        if fingerprint in seen_rows:
+            continue
+        signature = minhash(title, body) if with_signatures else None
+        rendered.append((title, clean_title, source_url, fingerprint, signature, body if with_signatures else None,
+                         render_post(title, post_date, source_url, body)))
+    
+    return rendered
+
+def workbook_sheet_names(excel_file):
+    """변환할 시트 목록 (CSV·JSON Lines·Parquet는 파일 전체가 시트 하나)"""
+    if not is_excel(excel_file):
+        return [0]
+    workbook = openpyxl.load_workbook(excel_file, read_only=True)
+    try:
+        return workbook.sheetnames
+    finally:
+        workbook.close()
+
+def convert_workbooks_parallel(excel_files, output_dir='_posts', manifest=None, url_index=None, workers=None,
+                               post_dates=None, metrics=None, cache=None, near_duplicates=None):
+    """여러 워크북의 모든 시트를 프로세스 풀에서 병렬로 변환
+
+    워커는 읽기와 렌더링만 하고, 중복 제거·파일명 결정·저장은 코디네이터가 작업 순서대로 처리하므로
+    실행할 때마다 같은 파일명이 나옵니다.
+    post_dates({워크북: datetime})가 주어지면 워크북마다 그 날짜로 변환하며, 날짜 파티션 순서(오래된 날짜 먼저)로
+    처리하므로 여러 날짜에 걸친 같은 기사는 가장 이른 날짜에만 게시됩니다.
+    metrics가 주어지면 워커의 읽기·렌더링을 기다린 시간(read_render)과 저장(write) 단계 지표를 기록합니다.
+    cache가 주어지면 워커들이 같은 캐시 디렉토리를 공유합니다.
+    near_duplicates가 주어지면 워커가 계산한 MinHash 서명으로 코디네이터가 같은 소식을 다룬 기사를 찾아 표시합니다.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    
+    current_date = datetime.now()
+    post_dates = post_dates or {}
+    
+    def partition_key(excel_file):
+        return post_dates.get(excel_file, current_date).strftime('%Y-%m-%d'), excel_file
+    
+    # 작업 목록: (날짜, 워크북, 시트) 순서로 정렬
+    tasks = []
+    for excel_file in sorted(excel_files, key=partition_key):
+        post_date = post_dates.get(excel_file, current_date).strftime('%Y-%m-%d %H:%M:%S +0900')
+        try:
+            sheet_names = workbook_sheet_names(excel_file)
+        except Exception as e:
+            print(f"Error processing Excel file: {e}")
+            continue
+        
+        seen_rows = frozenset(manifest.seen_rows(excel_file)) if manifest else frozenset()
+        if cache:
+            cache.fingerprint(excel_file)  # 내용 해시를 미리 계산해 두어 워커가 시트마다 다시 해시하지 않음
+        for sheet_name in sheet_names:
+            tasks.append((excel_file, sheet_name, post_date, seen_rows, cache, near_duplicates is not None))
+    
+    created_files = []
+    allocator = FilenameAllocator(output_dir)
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(render_sheet, task) for task in tasks]
+        
+        # 워크북 단위로 모든 시트가 성공해야 저장
+        for excel_file, group in groupby(zip(tasks, futures), key=lambda item: item[0][0]):
+            date_str = partition_key(excel_file)[0]
+            batch = WorkbookBatch(excel_file, output_dir, manifest, url_index, metrics, near_duplicates)
+            try:
+                for task, future in group:
+                    started = time.perf_counter()
+                    rendered = future.result()
+                    if metrics:
+                        metrics.record("read_render", time.perf_counter() - started, rows=len(rendered))
+                    
+                    for title, clean_title, source_url, fingerprint, signature, body, post_content in rendered:
+                        if batch.is_converted(fingerprint):
+                            continue
+                        
+                        # 이미 게시한 기사 건너뛰기 (다른 워크북에서 이번 실행에 추가된 링크 포함)
+                        if batch.is_duplicate(source_url):
+                            print(f"Skipped duplicate: {source_url}")
+                            batch.skip(fingerprint)
+                            continue
+                        
+                        near_duplicate_of = batch.near_duplicate_of(signature)
+                        if near_duplicate_of:
+                            print(f"Near-duplicate of {near_duplicate_of}: {title}")
+                            # 워커와 같은 포스트 날짜로 다시 렌더링 (task: 워크북, 시트, 포스트 날짜, ...)
+                            post_content = render_post(title, task[2], source_url, body, near_duplicate_of)
+                        
+                        filepath = allocator.allocate(date_str, clean_title)
+                        batch.add(filepath, post_content, source_url, fingerprint, signature, near_duplicate_of)
+                
+                created_files.extend(batch.commit())
+            except Exception as e:
+                batch.abort()
+                print(f"Error processing Excel file: {excel_file}: {e}")
+    
+    return created_files
+
+def published_posts(output_dir):
+    """게시한 포스트의 원문 링크 -> (파일 경로, front matter의 날짜 문자열, near_duplicate_of)"""
+    posts = {}
+    if not os.path.isdir(output_dir):
+        return posts
+    
+    for name in sorted(os.listdir(output_dir)):
+        filepath = os.path.join(output_dir, name)
+        meta = read_post_meta(filepath) if POST_FILENAME_PATTERN.match(name) else None
+        if not meta or not meta[2]:
+            continue
+        # 날짜는 다시 렌더링해도 같은 문자열이 되도록 front matter 줄을 그대로 사용
+        fields = {}
+        with open(filepath, 'r', encoding='utf-8') as f:
+            f.readline()
+            for line in f:
+                if line.rstrip('\n') == '---':
+                    break
+                key, _, value = line.partition(':')
+                if key in ('date', 'near_duplicate_of'):
+                    fields[key] = value.strip().strip('\'"')
+        if 'date' in fields:
+            posts.setdefault(meta[2], (filepath, fields['date'], fields.get('near_duplicate_of')))
+    return posts
+
+def rerender_posts(excel_files, output_dir='_posts', cache=None, metrics=None):
+    """이미 게시한 포스트를 워크북에서 다시 읽어 현재 템플릿으로 다시 생성 → 다시 쓴 파일 경로 목록
+
+    매니페스트와 URL 인덱스를 거치지 않고 모든 시트를 읽으며(cache가 주어지면 캐시에서 읽음),
+    원문 링크로 기존 포스트를 찾아 파일명·날짜·같은 소식 표시는 그대로 두고 내용이 바뀐 포스트만 다시 씁니다.
+    """
+    published = published_posts(output_dir)
+    rewritten = []
+    
+    for excel_file in excel_files:
+        try:
+            for sheet_name in workbook_sheet_names(excel_file):
+                records = iter_post_records(excel_file, sheet_name=sheet_name, cache=cache)
+                if metrics:
+                    records = metrics.timed_rows("read_excel", records)
+                for title, _, source_url, body, _ in records:
+                    # 같은 링크가 여러 번 나오면 처음 것만 사용 (변환할 때와 같은 규칙)
+                    post = published.pop(source_url, None)
+                    if post is None:
+                        continue
+                    
+                    filepath, post_date, near_duplicate_of = post
+                    content = render_post(title, post_date, source_url, body, near_duplicate_of)
+                    with open(filepath, 'r', encoding='utf-8') as f:
+                        if f.read() == content:
+                            continue
+                    tmp_path = f"{filepath}.tmp"
+                    write_file(tmp_path, content)
+                    os.replace(tmp_path, filepath)
+                    rewritten.append(filepath)
+        except Exception as e:
+            print(f"Error processing Excel file: {excel_file}: {e}")
+    
+    return rewritten
+
 if __name__ == "__main__":
     # Excel 파일 경로
     excel_file = "google_ai_news_20250518.xlsx"
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+블로그 포스트 YAML front matter 전용 직렬화
+포스트 스키마는 항상 같은 키와 문자열/문자열 목록 값만 가지므로, yaml.dump와 같은 결과를 직접 생성합니다.
+일반적이지 않은 값(여러 줄, 제어 문자, 80자를 넘는 줄 등)은 PyYAML로 처리합니다.
+"""
+
+import re
+from functools import lru_cache
+
+import yaml
+from yaml.resolver import Resolver
+
+# yaml.dump 기본 줄 너비 (이보다 긴 줄은 PyYAML이 접어서 출력하므로 fallback)
+LINE_WIDTH = 80
+
+_STR_TAG = 'tag:yaml.org,2002:str'
+_resolver = Resolver()
+
+# PyYAML emitter가 따옴표 안에서도 이스케이프하는 문자 (제어 문자, 줄바꿈, BOM 등; allow_unicode=True 기준)
+_SPECIAL_CHARACTERS = re.compile(
+    '[^\x20-\x7E\xA0-\U0000D7FF\U0000E000-\U0000FFFD\U00010000-\U0010FFFE]'
+    '|[\N{LINE SEPARATOR}\N{PARAGRAPH SEPARATOR}\N{ZERO WIDTH NO-BREAK SPACE}]'
+)
+
+# block 문맥에서 plain 스칼라를 쓸 수 없게 만드는 지시자 (첫 글자 지시자, ": ", " #", 앞뒤 공백)
+_PLAIN_FORBIDDEN = re.compile(r"""^(?:---|\.\.\.|[#,\[\]{}&*!|>'"%@`]|[?:-](?: |$)| )|:(?: |$)| #| $""")
+
+@lru_cache(maxsize=1024)
+def format_scalar(value):
+    """문자열 스칼라를 yaml.dump와 같은 형태로 변환 (직접 처리할 수 없으면 None)"""
+    if not value or _SPECIAL_CHARACTERS.search(value):
+        return None
+
+    # 'true', '123', '2025-01-01' 처럼 다른 타입으로 해석되는 값은 따옴표 필요
+    if not _PLAIN_FORBIDDEN.search(value) and _resolver.resolve(yaml.ScalarNode, value, (True, False)) == _STR_TAG:
+        return value
+    return "'" + value.replace("'", "''") + "'"
+
+def dump_front_matter(front_matter):
+    """front matter dict를 YAML 문자열로 변환 (yaml.dump(..., default_flow_style=False, allow_unicode=True)와 동일)"""
+    lines = []
+
+    for key in sorted(front_matter):
+        value = front_matter[key]
+
+        if isinstance(value, str):
+            scalar = format_scalar(value)
+            if scalar is None or len(key) + 2 + len(scalar) > LINE_WIDTH:
+                break
+            lines.append(f"{key}: {scalar}\n")
+
+        elif isinstance(value, list) and value and all(isinstance(item, str) for item in value):
+            items = [format_scalar(item) for item in value]
+            if any(item is None or len(item) + 2 > LINE_WIDTH for item in items):
+                break
+            lines.append(f"{key}:\n")
+            lines.extend(f"- {item}\n" for item in items)
+
+        else:
+            break
+    else:
+        if all(isinstance(key, str) and key.isidentifier() for key in front_matter):
+            return ''.join(lines)
+
+    # 일반적이지 않은 값은 PyYAML로 처리
+    # (libyaml CDumper는 여러 줄 문자열을 다른 따옴표 형식으로 출력하므로 기존 포스트와 같도록 순수 Python 구현 사용)
+    return yaml.dump(front_matter, default_flow_style=False, allow_unicode=True)
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+자동화 스크립트용 Git 명령 실행 계층
+shell과 os.chdir 없이 인자 목록과 cwd로 git을 실행하며, 지정한 파일만 pathspec으로 스테이징합니다.
+스테이징 비용이 저장소 전체 크기가 아니라 새 포스트 수에 비례하고, 여러 스레드에서 써도 안전합니다.
+"""
+
+import os
+import subprocess
+from datetime import datetime
+
+class GitError(Exception):
+    """git 명령 실패"""
+
+class GitRepository:
+    def __init__(self, root):
+        self.root = os.path.abspath(root)
+
+    def run(self, *args, input=None):
+        """git 명령 실행 (표준 출력 반환, 실패하면 GitError)"""
+        result = subprocess.run(
+            ["git", *args], cwd=self.root, input=input, capture_output=True, text=True
+        )
+        if result.returncode != 0:
+            raise GitError((result.stderr or result.stdout).strip())
+        return result.stdout
+
+    def relative_paths(self, paths):
+        """저장소 루트 기준 상대 경로 목록 (중복 제거, 순서 유지)"""
+        relative = {}
+        for path in paths:
+            if not os.path.isabs(path):
+                path = os.path.join(self.root, path)
+            relative[os.path.relpath(path, self.root)] = None
+        return list(relative)
+
+    def stage(self, paths):
+        """지정한 파일만 스테이징 (경로 목록을 NUL 구분 pathspec으로 표준 입력에 전달)"""
+        pathspecs = self.relative_paths(paths)
+        if not pathspecs:
+            return 0
+        self.run(
+            "add", "--pathspec-from-file=-", "--pathspec-file-nul",
+            input="\0".join(pathspecs) + "\0"
+        )
+        return len(pathspecs)
+
+    def stage_removed(self, paths):
+        """작업 트리에서 지운 파일의 삭제를 스테이징 (추적하지 않던 파일은 무시)"""
+        pathspecs = self.relative_paths(paths)
+        if not pathspecs:
+            return 0
+        self.run(
+            "rm", "--cached", "--quiet", "--ignore-unmatch", "--pathspec-from-file=-", "--pathspec-file-nul",
+            input="\0".join(pathspecs) + "\0"
+        )
+        return len(pathspecs)
+
+    def stage_changes(self, pathspecs):
+        """pathspec에 해당하는 파일 중 추가·수정·삭제된 것만 찾아 스테이징 → 스테이징한 파일 수
+
+        이전 실행에서 생성만 하고 커밋하지 못한 파일도 포함되며, 일치하는 파일이 없으면 아무것도 하지 않습니다.
+        """
+        output = self.run(
+            "ls-files", "-z", "--modified", "--deleted", "--others", "--exclude-standard", "--", *pathspecs
+        )
+        changed = list(dict.fromkeys(path for path in output.split("\0") if path))
+        written = [path for path in changed if os.path.exists(os.path.join(self.root, path))]
+        removed = [path for path in changed if not os.path.exists(os.path.join(self.root, path))]
+        return self.stage(written) + self.stage_removed(removed)
+
+    def has_staged_changes(self):
+        """스테이징된 변경사항이 있는지 확인"""
+        result = subprocess.run(
+            ["git", "diff", "--cached", "--quiet"], cwd=self.root, capture_output=True
+        )
+        return result.returncode == 1
+
+    def commit(self, message):
+        """스테이징된 변경사항 커밋 (커밋 SHA 반환, 커밋할 내용이 없으면 None)"""
+        if not self.has_staged_changes():
+            return None
+        self.run("commit", "-m", message)
+        return self.head()
+
+    def head(self):
+        """현재 HEAD 커밋 SHA"""
+        return self.run("rev-parse", "HEAD").strip()
+
+    def push(self, remote="origin", branch="master"):
+        """원격 저장소에 푸시"""
+        return self.run("push", remote, branch)
+
+    def resolve(self, ref):
+        """ref가 가리키는 커밋 SHA (없으면 None)"""
+        result = subprocess.run(
+            ["git", "rev-parse", "--verify", "--quiet", f"{ref}^{{commit}}"],
+            cwd=self.root, capture_output=True, text=True
+        )
+        return result.stdout.strip() if result.returncode == 0 else None
+
+    def current_branch(self):
+        """현재 체크아웃한 브랜치 이름 (detached HEAD면 None)"""
+        result = subprocess.run(
+            ["git", "symbolic-ref", "--quiet", "--short", "HEAD"], cwd=self.root, capture_output=True, text=True
+        )
+        return result.stdout.strip() if result.returncode == 0 else None
+
+    def identity(self, kind="COMMITTER"):
+        """설정된 작성자/커미터 (이름, 이메일)"""
+        ident = self.run("var", f"GIT_{kind}_IDENT").strip()
+        name, _, rest = ident.partition(" <")
+        return name, rest.split(">", 1)[0]
+
+    def update_worktree(self, old_commit, new_commit):
+        """브랜치가 old_commit에서 new_commit으로 이동한 만큼만 인덱스와 작업 트리에 반영"""
+        if old_commit:
+            self.run("read-tree", "-m", "-u", old_commit, new_commit)
+        else:
+            self.run("read-tree", "-m", "-u", new_commit)
+
+class FastImportStream:
+    """git fast-import 프로세스에 커밋을 직접 스트리밍 (작업 트리와 인덱스를 거치지 않음)
+
+    커밋마다 파일 내용을 inline blob으로 보내며, close() 후에 브랜치가 마지막 커밋을 가리킵니다.
+    """
+
+    def __init__(self, repository, branch="master"):
+        self.repository = repository
+        self.ref = f"refs/heads/{branch}"
+        self.parent = repository.resolve(self.ref)
+        self.committer = repository.identity("COMMITTER")
+        self.author = repository.identity("AUTHOR")
+        self.commits = 0
+        self.process = subprocess.Popen(
+            ["git", "fast-import", "--quiet", "--done", "--date-format=raw"],
+            cwd=repository.root, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE
+        )
+        self.stream = self.process.stdin
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+        return False
+
+    def write_data(self, data):
+        """fast-import data 블록 기록"""
+        self.stream.write(b"data %d\n" % len(data))
+        self.stream.write(data)
+        self.stream.write(b"\n")
+
+    def commit(self, message, files, author_date, commit_date=None):
+        """파일 (경로, 내용) 목록을 커밋 하나로 기록 (날짜는 timezone이 있는 datetime)"""
+        commit_date = commit_date or datetime.now(author_date.tzinfo)
+        stream = self.stream
+
+        stream.write(f"commit {self.ref}\n".encode('utf-8'))
+        stream.write(f"author {self.author[0]} <{self.author[1]}> {format_raw_date(author_date)}\n".encode('utf-8'))
+        stream.write(f"committer {self.committer[0]} <{self.committer[1]}> {format_raw_date(commit_date)}\n".encode('utf-8'))
+        self.write_data(message.encode('utf-8'))
+        if self.commits == 0 and self.parent:
+            stream.write(f"from {self.parent}\n".encode('utf-8'))
+
+        count = 0
+        for path, content in files:
+            stream.write(f"M 100644 inline {quote_path(path)}\n".encode('utf-8'))
+            self.write_data(content.encode('utf-8'))
+            count += 1
+
+        stream.write(b"\n")
+        self.commits += 1
+        return count
+
+    def close(self):
+        """스트림을 끝내고 브랜치 갱신 (새 커밋 SHA 반환, 커밋이 없으면 기존 SHA)"""
+        self.stream.write(b"done\n")
+        _, stderr = self.process.communicate()
+        if self.process.returncode != 0:
+            raise GitError(stderr.decode('utf-8', errors='replace').strip())
+        return self.repository.resolve(self.ref)
+
+    def abort(self):
+        """브랜치를 갱신하지 않고 fast-import 종료"""
+        self.process.kill()
+        self.process.wait()
+
+def format_raw_date(moment):
+    """fast-import raw 날짜 형식 ('<epoch초> +0900')"""
+    offset = int(moment.utcoffset().total_seconds() // 60)
+    sign = "+" if offset >= 0 else "-"
+    return f"{int(moment.timestamp())} {sign}{abs(offset) // 60:02d}{abs(offset) % 60:02d}"
+
+def quote_path(path):
+    """fast-import 경로 표기 (공백·따옴표 등이 있으면 C 스타일 따옴표 사용)"""
+    path = path.replace(os.sep, "/")
+    if not any(char in path for char in ' "\\\n') and not path.startswith('"'):
+        return path
+    escaped = path.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+    return f'"{escaped}"'
@@ -11,17 +11,98 @@ from datetime import datetime
 import os
 import json
 
+from notification_digest import MilestoneDigest, IMMEDIATE_STATUSES, plan_digest_sends, digest_subject, render_digest
+
 class GmailNotifier:
-    def __init__(self, sender_email, sender_password):
+    def __init__(self, sender_email, sender_password, smtp_server="smtp.gmail.com", port=587, use_tls=True):
         self.sender_email = sender_email
         self.sender_password = sender_password
-        self.smtp_server = "smtp.gmail.com"
-        self.port = 587
+        self.smtp_server = smtp_server
+        self.port = port
+        self.use_tls = use_tls
+        
+        # 여러 알림에서 재사용하는 SMTP 세션
+        self.server = None
+        
+        # 요약(digest) 모드: 알림을 모아 두었다가 flush_digest에서 한 번에 발송
+        self.digest = None
+        self.rate_limiter = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+    
+    def connect(self):
+        """SMTP 서버 연결 (STARTTLS 및 로그인 포함)"""
+        server = smtplib.SMTP(self.smtp_server, self.port, timeout=30)
+        try:
+            if self.use_tls:
+                server.starttls(context=ssl.create_default_context())
+            if self.sender_password:
+                server.login(self.sender_email, self.sender_password)
+        except Exception:
+            server.close()
+            raise
+        self.server = server
+        return server
+    
+    def get_connection(self):
+        """열려 있는 SMTP 세션 반환 (없으면 새로 연결)"""
+        if self.server is None:
+            return self.connect()
+        return self.server
+    
+    def close(self):
+        """SMTP 세션 종료"""
+        if self.server is None:
+            return
+        try:
+            self.server.quit()
+        except Exception:
+            self.server.close()
+        self.server = None
+    
+    def default_recipients(self):
+        """기본 수신자 목록"""
+        return [self.sender_email, "iysin0102@gmail.com"]
+    
+    def enable_digest(self, rate_limiter=None):
+        """요약 모드 사용 (실패 알림만 즉시 발송하고 나머지는 실행 종료 시 한 통으로 발송)"""
+        self.digest = MilestoneDigest()
+        self.rate_limiter = rate_limiter
+    
+    def flush_digest(self, recipients=None):
+        """모아 둔 알림을 요약 메일로 발송"""
+        if self.digest is None:
+            return True
+        if recipients is None:
+            recipients = self.default_recipients()
+        
+        success = True
+        for group_recipients, events in plan_digest_sends(self.digest.events, recipients, self.rate_limiter):
+            sent = self.send_email(group_recipients, digest_subject(events), render_digest(events))
+            success = success and sent
+            if self.rate_limiter:
+                self.rate_limiter.record_result(group_recipients, self.digest.events, sent)
+        
+        if self.rate_limiter:
+            self.rate_limiter.save()
+        self.digest.clear()
+        return success
     
     def send_milestone_notification(self, milestone_name, status, details="", recipients=None):
         """마일스톤 알림 이메일 발송"""
         if recipients is None:
-            recipients = [self.sender_email, "iysin0102@gmail.com"]
+            recipients = self.default_recipients()
+        
+        # 요약 모드에서는 기록만 하고, 실패 알림만 즉시 발송
+        if self.digest is not None:
+            self.digest.record(milestone_name, status, details)
+            if status not in IMMEDIATE_STATUSES:
+                return True
         
         # 이메일 제목
         subject = f"🚀 AI News Blog - {milestone_name} {status}"
@@ -76,19 +157,21 @@ class GmailNotifier:
             # 본문 추가
             message.attach(MIMEText(body, "plain", "utf-8"))
             
-            # SMTP 서버 연결 및 이메일 발송
-            context = ssl.create_default_context()
-            with smtplib.SMTP(self.smtp_server, self.port) as server:
-                server.starttls(context=context)
-                server.login(self.sender_email, self.sender_password)
-                text = message.as_string()
-                server.sendmail(self.sender_email, recipients, text)
+            # 기존 SMTP 세션으로 발송 (서버가 연결을 끊었으면 한 번 다시 연결)
+            text = message.as_string()
+            try:
+                self.get_connection().sendmail(self.sender_email, recipients, text)
+            except (smtplib.SMTPServerDisconnected, ConnectionResetError, BrokenPipeError):
+                self.close()
+                self.get_connection().sendmail(self.sender_email, recipients, text)
             
             print(f"✅ 이메일 발송 성공: {', '.join(recipients)}")
             return True
             
         except Exception as e:
             print(f"❌ 이메일 발송 실패: {e}")
+            # 세션 상태를 알 수 없으므로 다음 발송 때 새로 연결
+            self.close()
             return False
     
     def send_blog_update_notification(self, post_count, post_titles=None):
@@ -96,6 +179,11 @@ class GmailNotifier:
         if post_titles is None:
             post_titles = []
         
+        if self.digest is not None:
+            titles = "\n".join(f"{i}. {title}" for i, title in enumerate(post_titles[:10], 1))
+            self.digest.record("블로그 업데이트", "완료", f"새로 추가된 포스트: {post_count}개\n{titles}")
+            return True
+        
         subject = f"📰 AI News Blog 업데이트 - {post_count}개 새 포스트"
         
         body = f"""
@@ -120,8 +208,7 @@ class GmailNotifier:
 이 메시지는 자동으로 발송되었습니다.
         """
         
-        recipients = [self.sender_email, "iysin0102@gmail.com"]
-        return self.send_email(recipients, subject, body.strip())
+        return self.send_email(self.default_recipients(), subject, body.strip())
 
 def load_email_config():
     """이메일 설정 로드"""
@@ -142,6 +229,8 @@ def create_email_config_template():
     config = {
         "sender_email": "your-email@gmail.com",
         "sender_password": "your-app-password",
+        "digest": False,
+        "min_interval_minutes": 0,
         "note": "Gmail 앱 비밀번호를 사용하세요. 일반 비밀번호가 아닙니다!"
     }
     
@@ -162,10 +251,11 @@ if __name__ == "__main__":
         notifier = GmailNotifier(config["sender_email"], config["sender_password"])
         
         # 테스트 알림 발송
-        notifier.send_milestone_notification(
-            "시스템 테스트", 
-            "완료", 
-            "Gmail 연동 시스템이 정상적으로 작동합니다! 🎉"
-        )
+        with notifier:
+            notifier.send_milestone_notification(
+                "시스템 테스트", 
+                "완료", 
+                "Gmail 연동 시스템이 정상적으로 작동합니다! 🎉"
+            )
     else:
         print("❌ 이메일 설정이 필요합니다. email_config.json 파일을 설정하세요.") 
\ No newline at end of file
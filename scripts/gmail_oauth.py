@@ -6,42 +6,99 @@ Google Gmail API를 사용하여 OAuth 인증을 통해 이메일을 발송합
 
 import os
 import json
+import html
 import base64
+import importlib.util
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 import datetime
 
-try:
-    from google.auth.transport.requests import Request
-    from google.oauth2.credentials import Credentials
-    from google_auth_oauthlib.flow import InstalledAppFlow
-    from googleapiclient.discovery import build
-    from googleapiclient.errors import HttpError
-    GMAIL_API_AVAILABLE = True
-except ImportError:
-    GMAIL_API_AVAILABLE = False
+from notification_digest import (
+    MilestoneDigest, IMMEDIATE_STATUSES, split_milestone_title, plan_digest_sends, digest_subject, render_digest
+)
+
+def is_module_installed(name):
+    """모듈을 import하지 않고 설치 여부만 확인"""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except ModuleNotFoundError:
+        return False
+
+# Google API 클라이언트는 import 비용이 커서 실제로 인증·발송할 때 불러옴 (여기서는 설치 여부만 확인)
+GMAIL_API_AVAILABLE = all(
+    is_module_installed(module) for module in ("google_auth_oauthlib", "googleapiclient")
+)
+if not GMAIL_API_AVAILABLE:
     print("⚠️  Gmail API 라이브러리가 설치되지 않았습니다.")
     print("다음 명령어로 설치하세요: pip install google-auth google-auth-oauthlib google-auth-httplib2 google-api-python-client")
 
 # Gmail API 스코프
 SCOPES = ['https://www.googleapis.com/auth/gmail.send', 'https://www.googleapis.com/auth/userinfo.profile']
 
+# Gmail API 배치 요청 하나에 넣을 수 있는 최대 요청 수
+GMAIL_BATCH_LIMIT = 100
+
+# 프로세스당 한 번만 로드하는 OAuth 자격 증명
+_credentials = None
+
+def load_credentials():
+    """OAuth 자격 증명 로드 (프로세스당 한 번, 만료된 토큰은 갱신하거나 새로 인증)"""
+    global _credentials
+    if _credentials is not None and _credentials.valid:
+        return _credentials
+    
+    from google.auth.transport.requests import Request
+    from google.oauth2.credentials import Credentials
+    from google_auth_oauthlib.flow import InstalledAppFlow
+    
+    creds = _credentials
+    
+    # 기존 토큰 파일이 있으면 로드
+    if creds is None and os.path.exists('token.json'):
+        creds = Credentials.from_authorized_user_file('token.json', SCOPES)
+    
+    # 유효한 자격 증명이 없으면 새로 인증
+    if not creds or not creds.valid:
+        if creds and creds.expired and creds.refresh_token:
+            try:
+                creds.refresh(Request())
+            except Exception as e:
+                print(f"토큰 갱신 실패: {e}")
+                creds = None
+        
+        if not creds:
+            if not os.path.exists('credentials.json'):
+                print("⚠️  credentials.json 파일이 없습니다.")
+                print("Google Cloud Console에서 OAuth 클라이언트 자격 증명을 다운로드하세요.")
+                return None
+            
+            flow = InstalledAppFlow.from_client_secrets_file('credentials.json', SCOPES)
+            creds = flow.run_local_server(port=0)
+        
+        # 토큰 저장
+        with open('token.json', 'w') as token:
+            token.write(creds.to_json())
+    
+    _credentials = creds
+    return creds
+
 class GmailOAuthNotifier:
     def __init__(self):
-        """Gmail OAuth 알림 시스템 초기화"""
-        if not GMAIL_API_AVAILABLE:
-            self.service = None
-            return
-            
+        """Gmail OAuth 알림 시스템 초기화 (인증과 Gmail 서비스 생성은 첫 발송 때 수행)"""
+        # 요약(digest) 모드: 알림을 모아 두었다가 flush_digest에서 한 번에 발송
+        self.digest = None
+        self.rate_limiter = None
+        
         self.service = None
+        self.auth_failed = False
         self.sender_email = None
         self.recipients = []
         
+        if not GMAIL_API_AVAILABLE:
+            return
+        
         # OAuth 설정 로드
         self.load_config()
-        
-        # Gmail 서비스 초기화
-        self.authenticate()
     
     def load_config(self):
         """OAuth 설정 파일 로드"""
@@ -56,80 +113,160 @@ class GmailOAuthNotifier:
             print("⚠️  oauth_config.json 파일이 없습니다.")
             print("scripts/gmail_oauth.py를 먼저 실행하여 OAuth 설정을 완료하세요.")
     
+    def is_available(self):
+        """네트워크 없이 발송 가능 여부 확인 (라이브러리·수신자·자격 증명 파일)"""
+        if not GMAIL_API_AVAILABLE or not self.recipients or self.auth_failed:
+            return False
+        return self.service is not None or os.path.exists('token.json') or os.path.exists('credentials.json')
+    
+    def get_service(self):
+        """Gmail 서비스 반환 (처음 호출할 때 인증하고 생성)"""
+        if self.service is None and not self.auth_failed and GMAIL_API_AVAILABLE:
+            self.authenticate()
+        return self.service
+    
     def authenticate(self):
         """Gmail API OAuth 인증"""
-        creds = None
-        
-        # 기존 토큰 파일이 있으면 로드
-        if os.path.exists('token.json'):
-            creds = Credentials.from_authorized_user_file('token.json', SCOPES)
-        
-        # 유효한 자격 증명이 없으면 새로 인증
-        if not creds or not creds.valid:
-            if creds and creds.expired and creds.refresh_token:
-                try:
-                    creds.refresh(Request())
-                except Exception as e:
-                    print(f"토큰 갱신 실패: {e}")
-                    creds = None
-            
-            if not creds:
-                if not os.path.exists('credentials.json'):
-                    print("⚠️  credentials.json 파일이 없습니다.")
-                    print("Google Cloud Console에서 OAuth 클라이언트 자격 증명을 다운로드하세요.")
-                    return
-                
-                flow = InstalledAppFlow.from_client_secrets_file('credentials.json', SCOPES)
-                creds = flow.run_local_server(port=0)
-            
-            # 토큰 저장
-            with open('token.json', 'w') as token:
-                token.write(creds.to_json())
+        creds = load_credentials()
+        if creds is None:
+            self.auth_failed = True
+            return
+        
+        from googleapiclient.discovery import build
         
         try:
-            self.service = build('gmail', 'v1', credentials=creds)
+            # 패키지에 포함된 discovery 문서를 사용하여 네트워크 요청 없이 서비스 생성
+            self.service = build('gmail', 'v1', credentials=creds, static_discovery=True, cache_discovery=False)
             print("✅ Gmail API 인증 성공!")
         except Exception as e:
             print(f"❌ Gmail API 인증 실패: {e}")
             self.service = None
+            self.auth_failed = True
     
-    def create_message(self, to, subject, body):
-        """이메일 메시지 생성"""
+    def build_mime_message(self, to, subject, body):
+        """MIME 메시지 생성 (수신자만 바꿔 여러 번 인코딩할 수 있도록 인코딩 전 객체 반환)"""
         message = MIMEMultipart()
         message['to'] = to
         message['from'] = self.sender_email
         message['subject'] = subject
         
         message.attach(MIMEText(body, 'html', 'utf-8'))
-        
+        return message
+    
+    def encode_message(self, message):
+        """Gmail API 요청 본문으로 인코딩"""
         raw_message = base64.urlsafe_b64encode(message.as_bytes()).decode('utf-8')
         return {'raw': raw_message}
     
+    def create_message(self, to, subject, body):
+        """이메일 메시지 생성"""
+        return self.encode_message(self.build_mime_message(to, subject, body))
+    
     def send_email(self, to, subject, body):
         """이메일 발송"""
-        if not self.service:
+        service = self.get_service()
+        if not service:
             return False
         
+        from googleapiclient.errors import HttpError
+        
         try:
             message = self.create_message(to, subject, body)
-            result = self.service.users().messages().send(userId='me', body=message).execute()
+            result = service.users().messages().send(userId='me', body=message).execute()
             print(f"✅ 이메일 발송 성공: {to}")
             return True
         except HttpError as error:
             print(f"❌ 이메일 발송 실패 ({to}): {error}")
             return False
     
+    def send_batch(self, recipients, subject, body):
+        """수신자별로 같은 메일을 Gmail API 배치 요청으로 발송 ({수신자: 성공 여부} 반환)
+        
+        본문은 한 번만 생성하고 수신자 헤더만 바꿔 인코딩하며, 요청 수와 관계없이 HTTP 왕복은 배치당 한 번입니다.
+        """
+        results = {recipient: False for recipient in recipients}
+        if not recipients:
+            return results
+        service = self.get_service()
+        if not service:
+            return results
+        
+        message = self.build_mime_message(recipients[0], subject, body)
+        
+        def on_response(request_id, response, exception):
+            recipient = recipients[int(request_id)]
+            if exception is None:
+                results[recipient] = True
+                print(f"✅ 이메일 발송 성공: {recipient}")
+            else:
+                print(f"❌ 이메일 발송 실패 ({recipient}): {exception}")
+        
+        for start in range(0, len(recipients), GMAIL_BATCH_LIMIT):
+            batch = service.new_batch_http_request(callback=on_response)
+            for index in range(start, min(start + GMAIL_BATCH_LIMIT, len(recipients))):
+                message.replace_header('to', recipients[index])
+                request = service.users().messages().send(userId='me', body=self.encode_message(message))
+                batch.add(request, request_id=str(index))
+            
+            try:
+                batch.execute()
+            except Exception as error:
+                # 배치 요청 자체가 실패하면 응답을 받지 못한 수신자는 실패로 남음
+                print(f"❌ 배치 발송 실패: {error}")
+        
+        return results
+    
+    def enable_digest(self, rate_limiter=None):
+        """요약 모드 사용 (실패 알림만 즉시 발송하고 나머지는 실행 종료 시 한 통으로 발송)"""
+        self.digest = MilestoneDigest()
+        self.rate_limiter = rate_limiter
+    
+    def flush_digest(self):
+        """모아 둔 알림을 요약 메일로 발송"""
+        if self.digest is None:
+            return True
+        if not self.is_available():
+            self.digest.clear()
+            return False
+        
+        success = True
+        for group_recipients, events in plan_digest_sends(self.digest.events, self.recipients, self.rate_limiter):
+            summary = f"<pre style=\"font-size: 14px; white-space: pre-wrap;\">{html.escape(render_digest(events))}</pre>"
+            body = self.create_html_body("실행 요약", summary)
+            sent = self.send_email(", ".join(group_recipients), digest_subject(events), body)
+            success = success and sent
+            if self.rate_limiter:
+                self.rate_limiter.record_result(group_recipients, self.digest.events, sent)
+        
+        if self.rate_limiter:
+            self.rate_limiter.save()
+        self.digest.clear()
+        return success
+    
     def send_milestone_notification(self, milestone_info):
         """마일스톤 알림 이메일 발송"""
-        if not self.service or not self.recipients:
+        if not self.is_available():
             return False
         
         title = milestone_info.get('title', 'AI News Blog 알림')
         description = milestone_info.get('description', '')
         
+        # 요약 모드에서는 기록만 하고, 실패 알림만 즉시 발송
+        if self.digest is not None:
+            stage, status = split_milestone_title(title)
+            self.digest.record(stage, status, description)
+            if status not in IMMEDIATE_STATUSES:
+                return True
+        
         subject = f"🤖 AI News Blog - {title}"
+        body = self.create_html_body(title, description)
         
-        body = f"""
+        results = self.send_batch(self.recipients, subject, body)
+        return any(results.values())
+    
+    def create_html_body(self, title, description):
+        """알림 메일 HTML 본문 생성"""
+        return f"""
         <html>
         <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
             <div style="max-width: 600px; margin: 0 auto; padding: 20px;">
@@ -157,13 +294,6 @@ class GmailOAuthNotifier:
         </body>
         </html>
         """
-        
-        success_count = 0
-        for recipient in self.recipients:
-            if self.send_email(recipient, subject, body):
-                success_count += 1
-        
-        return success_count > 0
 
 def setup_oauth_config():
     """OAuth 설정 파일 생성"""
@@ -177,7 +307,9 @@ def setup_oauth_config():
         "recipients": [
             "winterkim.works@gmail.com",
             "iysin0102@gmail.com"
-        ]
+        ],
+        "digest": False,
+        "min_interval_minutes": 0
     }
     
     # OAuth 설정 파일 생성
@@ -219,7 +351,7 @@ def main():
     # Gmail OAuth 시스템 초기화
     notifier = GmailOAuthNotifier()
     
-    if notifier.service:
+    if notifier.get_service():
         # 테스트 알림 발송
         test_notification = {
             "title": "시스템 테스트",
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+이미 변환한 Excel 워크북과 행을 기록하는 수집 매니페스트
+워크북 내용 해시와 행 해시를 저장하여 변경되지 않은 파일은 건너뛰고, 새로 추가된 행만 변환합니다.
+"""
+
+import os
+import json
+import hashlib
+from datetime import datetime
+
+DEFAULT_MANIFEST_PATH = os.path.join(".automation", "ingest_manifest.json")
+
+def file_sha256(path, chunk_size=1024 * 1024):
+    """파일 내용의 SHA-256 해시 계산"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def cell_text(value):
+    """해시용 셀 값 문자열 (빈 셀은 빈 문자열, 정수인 float·참거짓은 정수로 취급)
+
+    pd.read_excel은 빈 셀이 섞인 정수·참거짓 열을 float로 읽고(483.0, 1.0), openpyxl 스트리밍은 그대로(483, True)
+    읽으므로 두 경로의 행 해시가 같도록 맞춥니다.
+    """
+    if value is None or value != value:
+        return ''
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    text = str(value)
+    if type(value).__name__ in ('bool', 'bool_'):  # numpy.bool_은 bool의 하위 클래스가 아님
+        return '1' if text == 'True' else '0'
+    return text
+
+def row_fingerprint(values):
+    """행의 셀 값으로 짧은 해시 생성 (--stream 여부와 관계없이 같은 행은 같은 해시)"""
+    text = '\x1f'.join(map(cell_text, values))
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=8).hexdigest()
+
+class IngestManifest:
+    def __init__(self, path=DEFAULT_MANIFEST_PATH):
+        self.path = path
+        self.workbooks = {}
+        self.dirty = False
+        self.load()
+
+    def load(self):
+        """매니페스트 파일 로드"""
+        if os.path.exists(self.path):
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self.workbooks = data.get("workbooks", {})
+
+        # 해시 → 워크북 이름 역인덱스 (O(1) 조회용)
+        self._by_hash = {entry["sha256"]: name for name, entry in self.workbooks.items()}
+        self._row_sets = {}
+
+    def save(self):
+        """매니페스트 파일 저장 (임시 파일에 쓴 뒤 교체)"""
+        if not self.dirty:
+            return
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({"version": 1, "workbooks": self.workbooks}, f, ensure_ascii=False, indent=1)
+        os.replace(tmp_path, self.path)
+        self.dirty = False
+
+    def is_unchanged(self, excel_file):
+        """이미 같은 내용으로 변환한 워크북인지 확인"""
+        name = os.path.basename(excel_file)
+        entry = self.workbooks.get(name)
+        stat = os.stat(excel_file)
+
+        # 크기와 수정 시각이 같으면 해시 계산 없이 건너뜀
+        if entry and entry.get("size") == stat.st_size and entry.get("mtime") == stat.st_mtime:
+            return True
+
+        return file_sha256(excel_file) in self._by_hash
+
+    def seen_rows(self, excel_file):
+        """해당 워크북에서 이미 변환한 행 해시 집합"""
+        name = os.path.basename(excel_file)
+        if name not in self._row_sets:
+            self._row_sets[name] = set(self.workbooks.get(name, {}).get("rows", []))
+        return self._row_sets[name]
+
+    def mark_row(self, excel_file, fingerprint):
+        """변환한 행 기록"""
+        self.seen_rows(excel_file).add(fingerprint)
+        self.dirty = True
+
+    def mark_workbook(self, excel_file):
+        """워크북 변환 완료 기록"""
+        name = os.path.basename(excel_file)
+        stat = os.stat(excel_file)
+        sha256 = file_sha256(excel_file)
+
+        previous = self.workbooks.get(name)
+        if previous:
+            self._by_hash.pop(previous["sha256"], None)
+
+        self.workbooks[name] = {
+            "sha256": sha256,
+            "size": stat.st_size,
+            "mtime": stat.st_mtime,
+            "rows": sorted(self.seen_rows(excel_file)),
+            "updated_at": datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        }
+        self._by_hash[sha256] = name
+        self.dirty = True
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+크롤링 결과 입력 형식별 행 읽기
+xlsx 외에 CSV, JSON Lines(NDJSON, 표준 입력 포함), Parquet 파일을 한 행씩 dict로 읽어
+excel_to_markdown의 스트리밍 변환 경로(제목/링크/내용 열 매핑)에 그대로 넘깁니다.
+새 형식은 register_reader로 확장자와 읽기 함수를 등록하면 됩니다.
+"""
+
+import io
+import os
+import sys
+import csv
+import glob
+import json
+
+# 표준 입력을 뜻하는 경로 (JSON Lines로 읽음)
+STDIN = "-"
+
+# 확장자 -> 행 읽기 함수 (경로를 받아 dict를 하나씩 반환)
+READERS = {}
+
+def register_reader(*suffixes):
+    """확장자에 행 읽기 함수 등록 (데코레이터)"""
+    def decorator(func):
+        for suffix in suffixes:
+            READERS[suffix.lower()] = func
+        return func
+    return decorator
+
+def input_suffix(path):
+    return os.path.splitext(path)[1].lower()
+
+def is_excel(path):
+    return input_suffix(path) == ".xlsx"
+
+def is_supported(path):
+    return path == STDIN or input_suffix(path) in READERS
+
+def input_patterns():
+    """프로젝트 루트에서 찾을 입력 파일 glob 패턴"""
+    return tuple(f"*{suffix}" for suffix in READERS)
+
+def input_name(path):
+    """로그에 표시할 입력 이름"""
+    return "<stdin>" if path == STDIN else os.path.basename(path)
+
+def iter_input_rows(path):
+    """입력 파일의 행을 dict로 하나씩 반환 (빈 값은 xlsx의 빈 셀처럼 NaN 또는 None)"""
+    if path == STDIN:
+        return iter_json_lines(io.TextIOWrapper(sys.stdin.buffer, encoding='utf-8-sig'), "<stdin>")
+
+    reader = READERS.get(input_suffix(path))
+    if reader is None:
+        raise ValueError(f"지원하지 않는 입력 형식: {path}")
+    return reader(path)
+
+def collect_inputs(paths):
+    """경로 목록에서 입력 파일 찾기 (디렉토리는 바로 아래의 지원 형식 파일, '-'는 표준 입력, 그 외는 glob 패턴)"""
+    input_files = []
+    stdin = False
+    for path in paths:
+        if path == STDIN:
+            stdin = True
+        elif os.path.isdir(path):
+            for pattern in input_patterns():
+                input_files.extend(glob.glob(os.path.join(path, pattern)))
+        else:
+            input_files.extend(f for f in glob.glob(path) if is_supported(f))
+    return sorted(set(os.path.abspath(f) for f in input_files)) + ([STDIN] if stdin else [])
+
+def flatten_nested_values(row):
+    """목록·객체 값을 JSON 문자열로 바꿈 (변환 경로는 셀처럼 스칼라 값만 받으며, pd.notna에 목록을 넘기면 오류)"""
+    for column, value in row.items():
+        if isinstance(value, (list, dict)):
+            row[column] = json.dumps(value, ensure_ascii=False)
+    return row
+
+@register_reader(".xlsx")
+def iter_xlsx_rows(path):
+    # pandas·openpyxl은 xlsx를 읽을 때만 불러옴
+    from excel_to_markdown import iter_excel_rows
+    return iter_excel_rows(path)
+
+@register_reader(".csv")
+def iter_csv_rows(path):
+    """CSV 행 읽기 (Excel에서 저장한 UTF-8 BOM 포함 파일 지원, 빈 칸은 NaN)"""
+    # 본문 열은 기본 한도(128KB)보다 길 수 있음
+    csv.field_size_limit(min(sys.maxsize, 2 ** 31 - 1))
+    empty = float('nan')
+    with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+        for row in csv.DictReader(f):
+            yield {column: empty if value == '' or value is None else value for column, value in row.items()}
+
+@register_reader(".jsonl", ".ndjson")
+def iter_jsonl_rows(path):
+    with open(path, 'r', encoding='utf-8-sig') as f:
+        yield from iter_json_lines(f, path)
+
+def iter_json_lines(lines, name):
+    """JSON Lines 행 읽기 (빈 줄은 건너뜀, 객체가 아닌 줄은 오류, 목록·객체 값은 JSON 문자열)"""
+    for number, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"{name}:{number}: JSON 형식 오류: {e}") from None
+        if not isinstance(row, dict):
+            raise ValueError(f"{name}:{number}: 행이 JSON 객체가 아닙니다")
+        yield flatten_nested_values(row)
+
+@register_reader(".parquet")
+def iter_parquet_rows(path, batch_size=8192):
+    """Parquet 행 읽기 (행 그룹을 batch_size행씩 읽어 메모리 사용량 일정, 목록·구조체 값은 JSON 문자열, pyarrow 필요)"""
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError("Parquet 입력을 읽으려면 pyarrow가 필요합니다 (pip install pyarrow)") from None
+
+    with pq.ParquetFile(path) as parquet_file:
+        for batch in parquet_file.iter_batches(batch_size=batch_size):
+            for row in batch.to_pylist():
+                yield flatten_nested_values(row)
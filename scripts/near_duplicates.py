@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+같은 소식을 다룬 기사(유사 중복) 감지
+제목(과 본문 앞부분)을 검색 색인과 같은 규칙으로 단어·bigram 집합으로 나눠 MinHash 서명을 만들고,
+서명을 2개 값씩 묶은 밴드(LSH)별 정렬 배열로 저장하여, 전체 기록을 훑지 않고 후보만 찾아 유사도를 확인합니다.
+원문 링크가 달라도 추정 Jaccard 유사도가 기준 이상이면 이미 게시한 기사와 같은 소식으로 보고,
+포스트는 그대로 게시하되 front matter의 near_duplicate_of에 그 소식을 처음 다룬 포스트 이름을 기록합니다.
+제목 단어 집합의 유사도만으로는 같은 분야 용어만 겹치는 다른 기사와 구분되지 않아(실제 같은 소식 0.3~0.4,
+다른 소식도 0.2대) 건너뛰지 않고 표시만 하며, process·backfill의 --mark-near-duplicates로 켭니다.
+"""
+
+import os
+import sys
+import glob
+import struct
+import random
+import zlib
+from array import array
+from bisect import bisect_left
+from itertools import chain
+
+import numpy as np
+
+from search_index import tokenize, read_post_body
+from site_pages import read_post_meta
+
+DEFAULT_INDEX_PATH = os.path.join(".automation", "near_duplicates.bin")
+
+# MinHash 서명 길이와 LSH 밴드 (밴드당 2개 값: Jaccard 0.3인 기사가 후보로 잡힐 확률 약 95%)
+NUM_PERM = 64
+ROWS = 2
+BANDS = NUM_PERM // ROWS
+
+# 이 이상 비슷하면 같은 소식으로 판단 (_posts의 같은 소식 제목 쌍은 Jaccard 0.32~0.33, 다른 소식은 최대 0.23)
+DEFAULT_THRESHOLD = 0.3
+
+# 단어가 너무 적은 제목('AI News' 등)은 우연히 겹치기 쉬우므로 검사하지 않음
+MIN_TOKENS = 5
+
+# 본문은 앞부분만 사용 (긴 본문이 제목보다 서명을 좌우하지 않도록)
+MAX_BODY_CHARS = 1000
+
+MERSENNE_PRIME = (1 << 31) - 1
+HEADER = struct.Struct("<4sHHI")
+MAGIC = b"NDP2"  # 버전 2: 문서별 소식(첫 포스트 이름) 목록 추가
+STORIES_LENGTH = struct.Struct("<Q")
+
+# 해시 함수 계수 (파일 형식의 일부이므로 seed를 바꾸면 인덱스 재구축 필요)
+_rng = random.Random(20250518)
+_A = np.array([_rng.randrange(1, MERSENNE_PRIME) for _ in range(NUM_PERM)], dtype=np.uint64)
+_B = np.array([_rng.randrange(0, MERSENNE_PRIME) for _ in range(NUM_PERM)], dtype=np.uint64)
+
+def minhash(title, body=None):
+    """제목(과 본문)의 MinHash 서명 (단어가 MIN_TOKENS개 미만이면 None)"""
+    text = str(title)
+    if body is not None and body == body:  # NaN 제외
+        text += "\n" + str(body)[:MAX_BODY_CHARS]
+
+    terms = tokenize(text)
+    if len(terms) < MIN_TOKENS:
+        return None
+
+    hashes = np.fromiter((zlib.crc32(term.encode('utf-8')) % MERSENNE_PRIME for term in terms),
+                         dtype=np.uint64, count=len(terms))
+    values = (_A[:, None] * hashes[None, :] + _B[:, None]) % MERSENNE_PRIME
+    return array('I', values.min(axis=1).astype(np.uint32).tobytes())
+
+def post_name(filepath):
+    """포스트 이름 (확장자 없는 파일명, Jekyll post_url 태그와 같은 형식)"""
+    return os.path.splitext(os.path.basename(filepath))[0]
+
+def band_keys(signature):
+    """밴드별 키 (밴드의 두 값을 64비트 정수 하나로)"""
+    return [(signature[i] << 32) | signature[i + 1] for i in range(0, NUM_PERM, ROWS)]
+
+class NearDuplicateIndex:
+    def __init__(self, path=DEFAULT_INDEX_PATH, threshold=DEFAULT_THRESHOLD):
+        self.path = path
+        self.threshold = threshold
+        self.signatures = array('I')  # 문서 번호 순서로 NUM_PERM개씩
+        self.keys = [array('Q') for _ in range(BANDS)]  # 밴드별 정렬된 키
+        self.docs = [array('I') for _ in range(BANDS)]  # 키와 같은 순서의 문서 번호
+        self.pending = [{} for _ in range(BANDS)]  # 저장 전에 추가한 문서: 밴드별 {키: [문서 번호]}
+        self.stories = []  # 문서 번호 -> 같은 소식을 처음 다룬 포스트 이름 (확장자 없는 파일명)
+        self.saved_count = 0
+
+    @classmethod
+    def load(cls, path=DEFAULT_INDEX_PATH, posts_dir=None, threshold=DEFAULT_THRESHOLD):
+        """인덱스 파일 로드 (파일이 없거나 형식이 다르고 posts_dir이 주어지면 기존 포스트에서 재구축)"""
+        index = cls(path, threshold)
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                magic, num_perm, bands, count = HEADER.unpack(f.read(HEADER.size))
+                if magic == MAGIC and num_perm == NUM_PERM and bands == BANDS:
+                    index.signatures.fromfile(f, count * NUM_PERM)
+                    for band in range(BANDS):
+                        index.keys[band].fromfile(f, count)
+                        index.docs[band].fromfile(f, count)
+                    length, = STORIES_LENGTH.unpack(f.read(STORIES_LENGTH.size))
+                    index.stories = f.read(length).decode('utf-8').split('\n') if count else []
+                    index.saved_count = count
+                    return index
+            print("⚠️  유사 중복 인덱스 형식이 달라 다시 만듭니다")
+
+        if posts_dir:
+            index.rebuild(posts_dir)
+        return index
+
+    def __len__(self):
+        return len(self.signatures) // NUM_PERM
+
+    def signature(self, doc_id):
+        return self.signatures[doc_id * NUM_PERM:(doc_id + 1) * NUM_PERM]
+
+    def find(self, signature):
+        """가장 비슷한 기존 문서 (문서 번호, 추정 유사도) (기준 미만이면 None)"""
+        if signature is None:
+            return None
+
+        candidates = set()
+        for band, key in enumerate(band_keys(signature)):
+            keys, docs = self.keys[band], self.docs[band]
+            position = bisect_left(keys, key)
+            while position < len(keys) and keys[position] == key:
+                candidates.add(docs[position])
+                position += 1
+            candidates.update(self.pending[band].get(key, ()))
+
+        best = None
+        for doc_id in candidates:
+            similarity = sum(map(int.__eq__, signature, self.signature(doc_id))) / NUM_PERM
+            if similarity >= self.threshold and (best is None or similarity > best[1]):
+                best = (doc_id, similarity)
+        return best
+
+    def story_of(self, signature):
+        """같은 소식으로 판단한 기존 포스트 묶음의 첫 포스트 이름 (없으면 None)"""
+        best = self.find(signature)
+        return self.stories[best[0]] if best else None
+
+    def add(self, signature, story):
+        """문서 추가 (story: 이 문서가 속한 소식의 첫 포스트 이름) → 문서 번호 (save 시 밴드별 정렬 배열에 병합)"""
+        doc_id = len(self)
+        self.signatures.extend(signature)
+        self.stories.append(story)
+        for band, key in enumerate(band_keys(signature)):
+            self.pending[band].setdefault(key, []).append(doc_id)
+        return doc_id
+
+    def rollback(self, count):
+        """저장하지 않은 문서 중 문서 번호가 count 이상인 것 제거 (워크북 변환 실패 시)"""
+        count = max(count, self.saved_count)
+        for band in range(BANDS):
+            for key in list(self.pending[band]):
+                docs = [doc_id for doc_id in self.pending[band][key] if doc_id < count]
+                if docs:
+                    self.pending[band][key] = docs
+                else:
+                    del self.pending[band][key]
+        del self.signatures[count * NUM_PERM:]
+        del self.stories[count:]
+
+    def rebuild(self, posts_dir):
+        """_posts의 제목·본문으로 인덱스 재구축 (파일명 순서대로 소식을 묶어 게시할 때와 같은 결과)"""
+        self.__init__(self.path, self.threshold)
+        for path in sorted(glob.glob(os.path.join(posts_dir, "*.md"))):
+            meta = read_post_meta(path)
+            signature = meta and minhash(meta[1], read_post_body(path))
+            if signature is not None:
+                self.add(signature, self.story_of(signature) or post_name(path))
+        return len(self)
+
+    def save(self):
+        """밴드별 정렬 배열에 새 문서를 병합하여 저장"""
+        for band in range(BANDS):
+            pending = sorted((key, doc_id) for key, docs in self.pending[band].items() for doc_id in docs)
+            if not pending:
+                continue
+
+            keys, docs = self.keys[band], self.docs[band]
+            if len(pending) * 8 > len(keys):
+                # 재구축처럼 새 문서가 많으면 한 번에 정렬
+                merged = sorted(chain(zip(keys, docs), pending))
+                self.keys[band] = array('Q', (key for key, _ in merged))
+                self.docs[band] = array('I', (doc_id for _, doc_id in merged))
+                self.pending[band] = {}
+                continue
+
+            # 새 키가 들어갈 위치에서만 잘라 붙임 (기존 배열을 다시 정렬하지 않음)
+            merged_keys, merged_docs = array('Q'), array('I')
+            start = 0
+            for key, doc_id in pending:
+                position = bisect_left(keys, key, start)
+                merged_keys.extend(keys[start:position])
+                merged_docs.extend(docs[start:position])
+                merged_keys.append(key)
+                merged_docs.append(doc_id)
+                start = position
+            merged_keys.extend(keys[start:])
+            merged_docs.extend(docs[start:])
+            self.keys[band], self.docs[band] = merged_keys, merged_docs
+            self.pending[band] = {}
+        self.saved_count = len(self)
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, NUM_PERM, BANDS, len(self)))
+            self.signatures.tofile(f)
+            for band in range(BANDS):
+                self.keys[band].tofile(f)
+                self.docs[band].tofile(f)
+            stories = '\n'.join(self.stories).encode('utf-8')
+            f.write(STORIES_LENGTH.pack(len(stories)))
+            f.write(stories)
+        os.replace(tmp_path, self.path)
+
+def invalidate(path=DEFAULT_INDEX_PATH):
+    """유사 중복 검사 없이 포스트를 추가했을 때 인덱스 파일 삭제 (다음 검사 때 _posts에서 재구축)"""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+if __name__ == "__main__":
+    # 기존 포스트로부터 인덱스 재구축
+    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    posts_dir = sys.argv[1] if len(sys.argv) > 1 else os.path.join(project_root, "_posts")
+
+    index = NearDuplicateIndex(os.path.join(project_root, DEFAULT_INDEX_PATH))
+    count = index.rebuild(posts_dir)
+    index.save()
+    print(f"✅ {count}개의 포스트로 유사 중복 인덱스를 재구축했습니다: {index.path}")
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+마일스톤 알림을 실행 단위 요약(digest) 메일로 묶는 기능
+실행 중 발생한 이벤트를 시각·단계별 소요 시간과 함께 모아 두었다가 실행이 끝날 때 한 통으로 발송합니다.
+수신자별 최소 발송 간격은 실행 간에 상태 파일로 유지하며, 간격이 지나지 않은 수신자의 이벤트는 다음 발송에 포함합니다.
+"""
+
+import os
+import json
+import time
+from datetime import datetime
+
+DEFAULT_STATE_PATH = os.path.join(".automation", "notification_state.json")
+
+# 즉시 발송하는 상태 (나머지는 요약 메일로 모음)
+IMMEDIATE_STATUSES = ("실패",)
+
+# 발송을 미룬 이벤트는 수신자당 최대 개수까지만 보관
+MAX_PENDING_EVENTS = 200
+
+STATUS_NAMES = ("시작", "진행중", "완료", "실패", "대기")
+
+def split_milestone_title(title):
+    """'데이터 처리 완료' 형태의 제목을 (단계, 상태)로 분리"""
+    stage, _, status = title.rpartition(" ")
+    if stage and status in STATUS_NAMES:
+        return stage, status
+    return title, ""
+
+class MilestoneDigest:
+    def __init__(self):
+        self.events = []
+        self.stage_started = {}
+
+    def __len__(self):
+        return len(self.events)
+
+    def record(self, milestone, status, details=""):
+        """이벤트 기록 ('시작' 이후 같은 단계의 다음 이벤트에는 소요 시간을 함께 기록)"""
+        now = time.monotonic()
+        duration = None
+        if status == "시작":
+            self.stage_started[milestone] = now
+        elif milestone in self.stage_started:
+            duration = round(now - self.stage_started.pop(milestone), 2)
+
+        self.events.append({
+            "time": datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            "milestone": milestone,
+            "status": status,
+            "duration": duration,
+            "details": details.strip() if details else ""
+        })
+
+    def clear(self):
+        """기록한 이벤트 비우기"""
+        self.events = []
+        self.stage_started = {}
+
+def digest_subject(events):
+    """요약 메일 제목 (실패가 있으면 제목에 표시)"""
+    failed = any(event["status"] == "실패" for event in events)
+    return f"{'❌' if failed else '📋'} AI News Blog - 실행 요약 ({len(events)}개 이벤트)"
+
+def render_digest(events):
+    """요약 메일 본문 (텍스트)"""
+    lines = ["📋 AI News Blog 자동화 실행 요약", ""]
+
+    for event in events:
+        line = f"[{event['time']}] {event['milestone']} {event['status']}".rstrip()
+        if event.get("duration") is not None:
+            line += f" ({event['duration']:.2f}초)"
+        lines.append(line)
+        if event.get("details"):
+            lines.extend(f"    {detail}" for detail in event["details"].splitlines())
+
+    lines += [
+        "",
+        "---",
+        "🔗 GitHub 저장소: https://github.com/winterkim-bot/sans",
+        "🌐 블로그 주소: https://winterkim-bot.github.io/sans",
+        "",
+        "이 메시지는 자동으로 발송되었습니다."
+    ]
+    return "\n".join(lines)
+
+class RecipientRateLimiter:
+    def __init__(self, path=DEFAULT_STATE_PATH, min_interval_minutes=0):
+        self.path = path
+        self.min_interval = min_interval_minutes * 60
+        self.state = {}
+
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                self.state = json.load(f).get("recipients", {})
+
+    def is_allowed(self, recipient, now=None):
+        """마지막 발송 후 최소 간격이 지났는지 확인"""
+        now = time.time() if now is None else now
+        last_sent = self.state.get(recipient, {}).get("last_sent", 0)
+        return now - last_sent >= self.min_interval
+
+    def pending_events(self, recipient):
+        """간격 제한으로 발송하지 못한 이벤트"""
+        return self.state.get(recipient, {}).get("pending", [])
+
+    def defer(self, recipient, events):
+        """다음 발송에 포함할 이벤트 보관"""
+        entry = self.state.setdefault(recipient, {})
+        entry["pending"] = (entry.get("pending", []) + events)[-MAX_PENDING_EVENTS:]
+
+    def mark_sent(self, recipient, now=None):
+        """발송 시각 기록 및 보관 중인 이벤트 비우기"""
+        entry = self.state.setdefault(recipient, {})
+        entry["last_sent"] = time.time() if now is None else now
+        entry["pending"] = []
+
+    def record_result(self, recipients, events, sent):
+        """발송 결과 기록 (실패하면 이번 이벤트를 다음 발송으로 넘김)"""
+        for recipient in recipients:
+            if sent:
+                self.mark_sent(recipient)
+            else:
+                self.defer(recipient, events)
+
+    def save(self):
+        """상태 파일 저장"""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({"recipients": self.state}, f, ensure_ascii=False, indent=1)
+        os.replace(tmp_path, self.path)
+
+def plan_digest_sends(events, recipients, rate_limiter=None):
+    """수신자별로 보낼 이벤트 목록을 정해 같은 내용끼리 묶음
+
+    반환값은 [(수신자 목록, 이벤트 목록), ...] 이며, 간격 제한에 걸린 수신자의 이벤트는 rate_limiter에 보관합니다.
+    """
+    if rate_limiter is None:
+        return [(list(recipients), events)] if events else []
+
+    groups = {}
+    for recipient in recipients:
+        recipient_events = rate_limiter.pending_events(recipient) + events
+        if not recipient_events:
+            continue
+        if not rate_limiter.is_allowed(recipient):
+            rate_limiter.defer(recipient, events)
+            continue
+
+        key = json.dumps(recipient_events, sort_keys=True, ensure_ascii=False)
+        groups.setdefault(key, (recipient_events, []))[1].append(recipient)
+
+    return [(group_recipients, group_events) for group_events, group_recipients in groups.values()]
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+이메일 알림을 백그라운드 스레드에서 발송하는 디스패처
+파이프라인은 알림을 큐에 넣고 바로 다음 단계로 진행하며, 종료 시 남은 알림을 제한 시간 안에 발송합니다.
+"""
+
+import queue
+import threading
+import time
+
+class NotificationDispatcher:
+    def __init__(self, maxsize=100, metrics=None):
+        self.queue = queue.Queue(maxsize=maxsize)
+        self.metrics = metrics  # 주어지면 발송 시간을 notify 단계로 기록
+        self.dropped = 0
+        self.closed = False
+
+        # 데몬 스레드: 메일 서버가 응답하지 않아도 프로세스 종료를 막지 않음
+        self.thread = threading.Thread(target=self._run, name="notification-dispatcher", daemon=True)
+        self.thread.start()
+
+    def submit(self, func, *args, **kwargs):
+        """알림 발송 작업을 큐에 추가 (큐가 가득 차면 버리고 False 반환)"""
+        if self.closed:
+            return False
+        try:
+            self.queue.put_nowait((func, args, kwargs))
+            return True
+        except queue.Full:
+            self.dropped += 1
+            print(f"⚠️  알림 큐가 가득 차서 알림을 버렸습니다 (누적 {self.dropped}개)")
+            return False
+
+    def _run(self):
+        """큐에 들어온 순서대로 알림 발송"""
+        while True:
+            item = self.queue.get()
+            try:
+                if item is None:
+                    return
+                func, args, kwargs = item
+                started = time.perf_counter()
+                try:
+                    func(*args, **kwargs)
+                except Exception as e:
+                    print(f"❌ 알림 발송 실패: {e}")
+                finally:
+                    if self.metrics:
+                        self.metrics.record("notify", time.perf_counter() - started)
+            finally:
+                self.queue.task_done()
+
+    def shutdown(self, timeout=30):
+        """남은 알림을 timeout초 안에 발송하고 종료 (모두 발송했으면 True)"""
+        if self.closed:
+            return not self.thread.is_alive()
+        self.closed = True
+
+        deadline = time.monotonic() + timeout
+        sentinel_queued = True
+        try:
+            self.queue.put(None, timeout=max(0, deadline - time.monotonic()))
+        except queue.Full:
+            sentinel_queued = False
+        self.thread.join(max(0, deadline - time.monotonic()))
+
+        if self.thread.is_alive():
+            pending = self.queue.qsize() - (1 if sentinel_queued else 0)
+            print(f"⚠️  제한 시간({timeout}초) 안에 발송하지 못한 알림이 {pending}개 있습니다")
+            return False
+        return True
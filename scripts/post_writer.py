@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+포스트 파일을 배치 단위로 원자적으로 저장하는 writer
+임시(staging) 디렉토리에 백그라운드 스레드로 파일을 쓰고, 배치가 끝나면 _posts로 한꺼번에 이동합니다.
+중간에 실패하면 이미 옮긴 파일까지 되돌려서 Jekyll이 일부만 저장된 배치를 보지 않도록 합니다.
+"""
+
+import os
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+STAGING_PREFIX = ".staging-"
+
+def write_file(path, content, fsync=True):
+    """파일을 끝까지 쓰고 디스크에 반영"""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(content)
+        if fsync:
+            f.flush()
+            os.fsync(f.fileno())
+    return len(content.encode('utf-8'))
+
+class PostWriter:
+    def __init__(self, output_dir, workers=4, fsync=True):
+        self.output_dir = output_dir
+        self.fsync = fsync
+        self.bytes_written = 0
+
+        # 같은 파일시스템에서 rename이 원자적이도록 출력 디렉토리 옆에 staging 디렉토리 생성
+        parent_dir = os.path.dirname(os.path.abspath(output_dir))
+        self.staging_dir = tempfile.mkdtemp(prefix=STAGING_PREFIX, dir=parent_dir)
+
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+        self.futures = []
+        self.staged = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.commit()
+        else:
+            self.abort()
+        return False
+
+    def write(self, filepath, content):
+        """포스트 저장 예약 (staging 디렉토리에 백그라운드로 기록)"""
+        staging_path = os.path.join(self.staging_dir, os.path.basename(filepath))
+        self.futures.append(self.executor.submit(write_file, staging_path, content, self.fsync))
+        self.staged.append((staging_path, filepath))
+
+    def commit(self):
+        """모든 파일이 기록되면 출력 디렉토리로 이동 (실패 시 배치 전체를 되돌리고 예외 발생)"""
+        moved = []
+        try:
+            # 기록 완료 대기 (하나라도 실패하면 예외)
+            for future in self.futures:
+                self.bytes_written += future.result()
+
+            os.makedirs(self.output_dir, exist_ok=True)
+            for staging_path, filepath in self.staged:
+                if os.path.exists(filepath):
+                    raise FileExistsError(f"이미 존재하는 포스트: {filepath}")
+                os.replace(staging_path, filepath)
+                moved.append(filepath)
+        except Exception:
+            for filepath in moved:
+                try:
+                    os.remove(filepath)
+                except OSError:
+                    pass
+            raise
+        finally:
+            self.close()
+
+        return [filepath for _, filepath in self.staged]
+
+    def abort(self):
+        """기록 중인 배치를 버림"""
+        self.close()
+
+    def close(self):
+        """스레드 풀 종료 및 staging 디렉토리 정리"""
+        self.executor.shutdown(wait=True)
+        shutil.rmtree(self.staging_dir, ignore_errors=True)
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+자동화 파이프라인 단계별 실행 지표
+단계마다 소요 시간·호출 횟수·처리 행 수·기록 바이트를 모아 JSON 실행 리포트(선택적으로 Prometheus 텍스트)로 저장합니다.
+단계당 perf_counter 두 번과 딕셔너리 갱신만 하므로 항상 켜 두어도 부담이 거의 없습니다.
+"""
+
+import os
+import json
+import time
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+
+DEFAULT_REPORT_PATH = os.path.join(".automation", "run_report.json")
+
+# Prometheus 지표 이름 접두사
+METRIC_PREFIX = "blog_automation"
+
+class RunMetrics:
+    def __init__(self):
+        self.started_at = datetime.now()
+        self.started = time.perf_counter()
+        self.stages = {}
+        self.lock = threading.Lock()  # 알림 발송 스레드에서도 기록
+
+    def entry(self, name):
+        stage = self.stages.get(name)
+        if stage is None:
+            stage = self.stages[name] = {"calls": 0, "seconds": 0.0, "rows": 0, "bytes": 0}
+        return stage
+
+    def record(self, name, seconds=0.0, rows=0, bytes=0, calls=1):
+        """단계 하나의 실행 결과 누적"""
+        with self.lock:
+            stage = self.entry(name)
+            stage["calls"] += calls
+            stage["seconds"] += seconds
+            stage["rows"] += rows
+            stage["bytes"] += bytes
+
+    @contextmanager
+    def stage(self, name):
+        """with 블록의 소요 시간을 단계에 기록 (예외가 나도 기록)"""
+        started = time.perf_counter()
+        try:
+            yield self
+        finally:
+            self.record(name, time.perf_counter() - started)
+
+    def timed_call(self, name, func, rows=0):
+        """호출할 때마다 소요 시간(과 호출당 rows개의 행)을 기록하는 함수로 감싸기"""
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.record(name, time.perf_counter() - started, rows=rows)
+        return wrapper
+
+    def timed_rows(self, name, rows):
+        """반복자에서 다음 행을 가져오는 데 걸린 시간과 행 수를 기록 (생성기 본문의 읽기 비용 측정)"""
+        iterator = iter(rows)
+        seconds = 0.0
+        count = 0
+        try:
+            while True:
+                started = time.perf_counter()
+                try:
+                    row = next(iterator)
+                except StopIteration:
+                    break
+                finally:
+                    seconds += time.perf_counter() - started
+                count += 1
+                yield row
+        finally:
+            self.record(name, seconds, rows=count)
+
+    def report(self):
+        """JSON으로 저장할 실행 리포트"""
+        with self.lock:
+            stages = {}
+            for name, stage in self.stages.items():
+                stages[name] = dict(stage, seconds=round(stage["seconds"], 6))
+                if stage["rows"] and stage["seconds"] > 0:
+                    stages[name]["rows_per_sec"] = round(stage["rows"] / stage["seconds"], 1)
+
+        return {
+            "started_at": self.started_at.strftime('%Y-%m-%d %H:%M:%S'),
+            "finished_at": datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            "wall_seconds": round(time.perf_counter() - self.started, 6),
+            "stages": stages
+        }
+
+    def to_prometheus(self, report=None):
+        """Prometheus 텍스트 형식 (node_exporter textfile collector용)"""
+        report = report or self.report()
+        lines = [
+            f"# HELP {METRIC_PREFIX}_run_seconds Wall time of the last automation run",
+            f"# TYPE {METRIC_PREFIX}_run_seconds gauge",
+            f"{METRIC_PREFIX}_run_seconds {report['wall_seconds']}"
+        ]
+        for field, help_text in (("seconds", "Wall time spent in each pipeline stage"),
+                                 ("calls", "Number of calls of each pipeline stage"),
+                                 ("rows", "Rows processed by each pipeline stage"),
+                                 ("bytes", "Bytes written by each pipeline stage")):
+            metric = f"{METRIC_PREFIX}_stage_{field}"
+            lines += [f"# HELP {metric} {help_text}", f"# TYPE {metric} gauge"]
+            for name, stage in sorted(report["stages"].items()):
+                lines.append(f'{metric}{{stage="{name}"}} {stage[field]}')
+        return "\n".join(lines) + "\n"
+
+    def save(self, path=DEFAULT_REPORT_PATH, prometheus_path=None):
+        """실행 리포트 저장 (prometheus_path가 주어지면 Prometheus 텍스트도 저장)"""
+        report = self.report()
+        write_atomic(path, json.dumps(report, ensure_ascii=False, indent=1) + "\n")
+        if prometheus_path:
+            write_atomic(prometheus_path, self.to_prometheus(report))
+        return report
+
+def write_atomic(path, text):
+    """임시 파일에 쓴 뒤 교체 (수집기가 반쯤 쓴 파일을 읽지 않도록)"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(tmp_path, path)
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+블로그 검색용 정적 역색인
+포스트 제목·본문을 한글·한자는 글자 bigram, 영문·숫자는 단어 단위로 나눠 역색인을 만들고,
+단어 해시로 나눈 샤드(search/index/*.json)와 문서 목록 샤드(search/docs/*.json)로 저장합니다.
+브라우저(assets/js/search.js)는 검색어에 해당하는 샤드만 받아 교집합을 구합니다.
+새 포스트는 뒤에 번호를 붙여 추가하므로, 실행마다 새 포스트의 단어가 속한 샤드만 다시 씁니다.
+색인 상태(.automation/search_state.json)는 커밋하지 않으며, 없으면 문서 목록 샤드에서 다시 만듭니다.
+"""
+
+import os
+import re
+import glob
+import json
+import unicodedata
+from collections import defaultdict
+
+from site_pages import POST_FILENAME_PATTERN, read_post_meta, jekyll_post_url
+
+SEARCH_DIR = "search"
+DEFAULT_STATE_PATH = os.path.join(".automation", "search_state.json")
+
+# 생성하는 샤드와 메타 파일의 pathspec (커밋할 때 이전 실행에서 생성한 파일까지 스테이징)
+OUTPUT_PATHSPECS = (f":(glob){SEARCH_DIR}/**/*.json",)
+
+# 색인 샤드 수 (단어 해시 % 샤드 수) — 바꾸면 --rebuild 필요
+INDEX_SHARDS = 1024
+
+# 문서 목록 샤드 하나의 문서 수
+DOC_SHARD_SIZE = 500
+
+# 본문은 앞부분만 색인 (색인 크기를 포스트 수에 비례하게 유지)
+MAX_BODY_CHARS = 2000
+
+# 한글 음절·CJK 한자 연속 구간은 bigram, 영문·숫자 연속 구간은 단어
+TOKEN_PATTERN = re.compile('[\U0000AC00-\U0000D7A3\U00004E00-\U00009FFF]+|[a-z0-9]+')
+BIGRAM_SCRIPT = re.compile('[\U0000AC00-\U0000D7A3\U00004E00-\U00009FFF]')
+
+def tokenize(text):
+    """검색 단어 집합 (search.js의 tokenize와 같은 규칙)"""
+    terms = set()
+    for run in TOKEN_PATTERN.findall(unicodedata.normalize('NFKC', text).lower()):
+        if BIGRAM_SCRIPT.match(run):
+            terms.update(run[i:i + 2] for i in range(len(run) - 1))
+        elif len(run) >= 2:
+            terms.add(run)
+    return terms
+
+def term_shard(term, shards=INDEX_SHARDS):
+    """단어가 속한 샤드 번호 (UTF-8 바이트의 FNV-1a 32비트 해시, search.js와 동일)"""
+    h = 0x811c9dc5
+    for byte in term.encode('utf-8'):
+        h = ((h ^ byte) * 0x01000193) & 0xffffffff
+    return h % shards
+
+def read_post_body(filepath):
+    """포스트 본문 (front matter·제목 줄·원문 링크·자동 생성 표시 제외)"""
+    with open(filepath, 'r', encoding='utf-8') as f:
+        content = f.read()
+
+    parts = content.split('\n---\n', 1)
+    body = parts[1] if len(parts) > 1 else content
+    lines = []
+    for line in body.split('\n'):
+        if line == '---' or line.startswith('[원문 보기]('):
+            break
+        if not line.startswith('# '):
+            lines.append(line)
+    return '\n'.join(lines).strip()[:MAX_BODY_CHARS]
+
+def write_json(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(tmp_path, path)
+
+def read_json(path, default):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return default
+
+class SearchIndex:
+    """샤드별 역색인 파일과 색인 상태 (포스트 파일명 -> 문서 번호)"""
+
+    def __init__(self, root, state_path=None, baseurl=""):
+        self.root = root
+        self.directory = os.path.join(root, SEARCH_DIR)
+        self.state_path = state_path or os.path.join(root, DEFAULT_STATE_PATH)
+        self.baseurl = baseurl
+        state = read_json(self.state_path, None)
+        self.recovered = state is None
+        if state is None:
+            state = self.recover_state()
+        self.needs_rebuild = state is None
+        state = state or {}
+        self.docs = state.get("docs", {})
+        self.next_id = state.get("next_id", 0)
+        self.changed = []
+
+    def recover_state(self):
+        """상태 파일이 없을 때 커밋된 문서 목록 샤드에서 상태 복원 (파일명이 없는 이전 형식이면 None → 다시 생성)"""
+        meta = read_json(os.path.join(self.directory, "meta.json"), None)
+        if meta is None:
+            return {}
+        if "next_id" not in meta:
+            return None
+
+        docs = {}
+        for path in glob.glob(os.path.join(self.directory, "docs", "*.json")):
+            number = int(os.path.splitext(os.path.basename(path))[0])
+            for position, doc in enumerate(read_json(path, [])):
+                if doc is None:
+                    continue
+                if len(doc) < 4:
+                    return None
+                docs[doc[3]] = number * DOC_SHARD_SIZE + position
+        return {"next_id": meta["next_id"], "docs": docs}
+
+    def shard_path(self, kind, number):
+        return os.path.join(self.directory, kind, f"{number}.json")
+
+    def update(self, posts_dir):
+        """새 포스트를 색인에 추가하고 지워진 포스트는 문서 목록에서 제거 → 바뀐 파일 경로 목록"""
+        filenames = sorted(name for name in os.listdir(posts_dir) if POST_FILENAME_PATTERN.match(name)) \
+            if os.path.isdir(posts_dir) else []
+        present = set(filenames)
+
+        # 문서 샤드별 변경: {샤드 번호: {샤드 안 위치: 문서 또는 None}}
+        doc_updates = defaultdict(dict)
+        removed = [name for name in self.docs if name not in present]
+        for name in removed:
+            doc_id = self.docs.pop(name)
+            doc_updates[doc_id // DOC_SHARD_SIZE][doc_id % DOC_SHARD_SIZE] = None
+
+        new_posts = [name for name in filenames if name not in self.docs]
+        metas = {name: read_post_meta(os.path.join(posts_dir, name)) for name in new_posts}
+        # 오래된 포스트부터 번호를 붙여 문서 번호가 대략 날짜순이 되도록 함
+        new_posts.sort(key=lambda name: ((metas[name] or [''])[0], name))
+
+        postings = defaultdict(lambda: defaultdict(list))  # 샤드 -> 단어 -> 새 문서 번호
+        for name in new_posts:
+            meta = metas[name]
+            if meta is None:
+                continue
+            date, title, source_url = meta[:3]
+            doc_id = self.next_id
+            self.next_id += 1
+            self.docs[name] = doc_id
+
+            url = source_url or jekyll_post_url(name, self.baseurl)
+            doc_updates[doc_id // DOC_SHARD_SIZE][doc_id % DOC_SHARD_SIZE] = [title, url, date[:10], name]
+            for term in tokenize(title + '\n' + read_post_body(os.path.join(posts_dir, name))):
+                postings[term_shard(term)][term].append(doc_id)
+
+        for number, entries in doc_updates.items():
+            self.update_doc_shard(number, entries)
+        for number, terms in postings.items():
+            self.update_index_shard(number, terms)
+
+        if doc_updates or postings:
+            meta_path = os.path.join(self.directory, "meta.json")
+            write_json(meta_path, {"version": 1, "shards": INDEX_SHARDS, "doc_shard_size": DOC_SHARD_SIZE,
+                                   "docs": len(self.docs), "next_id": self.next_id})
+            self.changed.append(meta_path)
+        if doc_updates or postings or self.recovered:
+            write_json(self.state_path, {"version": 1, "next_id": self.next_id, "docs": self.docs})
+
+        print(f"🔎 검색 색인: {len(new_posts)}개 추가, {len(removed)}개 제거 ({len(self.changed)}개 파일 갱신)")
+        return self.changed
+
+    def update_doc_shard(self, number, entries):
+        """문서 목록 샤드: [[제목, 주소, 날짜, 포스트 파일명] 또는 null, ...] (문서 번호 % DOC_SHARD_SIZE 위치)"""
+        path = self.shard_path("docs", number)
+        docs = read_json(path, [])
+        for position, doc in sorted(entries.items()):
+            docs.extend([None] * (position + 1 - len(docs)))
+            docs[position] = doc
+        write_json(path, docs)
+        self.changed.append(path)
+
+    def update_index_shard(self, number, terms):
+        """색인 샤드: {단어: [첫 문서 번호, 차이, 차이, ...]} (문서 번호 오름차순, 차이로 저장해 크기 축소)"""
+        path = self.shard_path("index", number)
+        index = read_json(path, {})
+        for term, doc_ids in terms.items():
+            deltas = index.setdefault(term, [])
+            last = sum(deltas)
+            for doc_id in doc_ids:
+                deltas.append(doc_id - last)
+                last = doc_id
+        write_json(path, index)
+        self.changed.append(path)
+
+def update_search_index(root, posts_dir, state_path=None, baseurl="", rebuild=False):
+    """새 포스트를 검색 색인에 반영 → 바뀐 파일 경로 목록 (rebuild=True면 처음부터 다시 생성)"""
+    search = SearchIndex(root, state_path, baseurl)
+    if rebuild or search.needs_rebuild:
+        search.docs, search.next_id = {}, 0
+        for kind in ("index", "docs"):
+            directory = os.path.join(search.directory, kind)
+            if os.path.isdir(directory):
+                for name in os.listdir(directory):
+                    path = os.path.join(directory, name)
+                    os.remove(path)
+                    search.changed.append(path)
+    return search.update(posts_dir)
@@ -0,0 +1,378 @@
+#!/usr/bin/env python3
+"""
+포스트 목록 페이지·월별 아카이브·사이트맵 생성
+홈 레이아웃이 site.posts 전체를 한 페이지에 그리지 않도록, 목록을 고정 크기 페이지로 나눈 정적 HTML을 미리 만들어 둡니다.
+페이지 번호는 가장 오래된 포스트부터 매기므로(1페이지가 가장 오래됨) 새 포스트가 추가되면 마지막 페이지만 바뀝니다.
+페이지마다 구성(포스트 파일명과 이전/다음 링크)의 해시를 .automation/site_index.json에 기록하여, 바뀐 페이지만 다시 씁니다.
+site_index.json은 커밋하지 않는 로컬 상태이며, 없으면 _posts와 이미 생성된 페이지를 다시 읽어 만듭니다.
+"""
+
+import os
+import re
+import glob
+import json
+import hashlib
+from html import escape
+from functools import partial
+from itertools import groupby
+from urllib.parse import quote
+
+DEFAULT_SITE_INDEX_PATH = os.path.join(".automation", "site_index.json")
+
+# 목록 페이지 하나의 포스트 수
+DEFAULT_PAGE_SIZE = 50
+
+PAGES_DIR = "page"
+ARCHIVE_DIR = "archive"
+SITEMAP_DIR = "sitemaps"
+SITEMAP_INDEX = "sitemap.xml"
+PAGINATION_DATA = os.path.join("_data", "pagination.json")
+
+# 생성하는 파일 전체의 pathspec (커밋할 때 이전 실행에서 생성한 파일까지 스테이징)
+OUTPUT_PATHSPECS = (
+    f":(glob){PAGES_DIR}/*/index.html",
+    f":(glob){ARCHIVE_DIR}/**/index.html",
+    f":(glob){SITEMAP_DIR}/sitemap-*.xml",
+    SITEMAP_INDEX,
+    "_data/pagination.json",
+)
+
+# 페이지 마크업을 바꾸면 올려서 모든 페이지를 다시 생성
+RENDER_VERSION = 2
+
+# site_index.json 형식 (포스트 메타데이터 항목이 바뀌면 올림)
+INDEX_VERSION = 2
+
+POST_FILENAME_PATTERN = re.compile(r'^(\d{4})-(\d{2})-(\d{2})-(.+)\.md$')
+FRONT_MATTER_FIELD = re.compile(r'^(date|title|source_url|categories): ?(.*)$')
+FRONT_MATTER_LIST_ITEM = re.compile(r'^- (.+)$')
+
+def read_post_meta(filepath):
+    """포스트 front matter에서 (날짜, 제목, 원문 링크, 카테고리 목록) 읽기"""
+    fields = {}
+    with open(filepath, 'r', encoding='utf-8') as f:
+        if f.readline().strip() != '---':
+            return None
+        lines = []
+        for line in f:
+            if line.rstrip('\n') == '---':
+                break
+            lines.append(line)
+
+    # 자동 생성 포스트의 front matter는 한 줄짜리 스칼라라서 대부분 직접 읽고, 따옴표 등이 있으면 PyYAML로 해석
+    simple = True
+    categories = []
+    list_key = None
+    for line in lines:
+        line = line.rstrip('\n')
+        item = FRONT_MATTER_LIST_ITEM.match(line)
+        if item and list_key == 'categories':
+            if item.group(1)[:1] in ("'", '"'):
+                simple = False
+            categories.append(item.group(1))
+            continue
+        list_key = None
+        match = FRONT_MATTER_FIELD.match(line)
+        if match:
+            key, value = match.groups()
+            if key == 'categories':
+                # 블록 목록('- ai')만 직접 읽고, 한 줄 목록이나 문자열은 PyYAML로 해석
+                if value:
+                    simple = False
+                list_key = key
+                continue
+            if value[:1] in ("'", '"', '>', '|') or not value:
+                simple = False
+            fields[key] = value
+    if not simple:
+        import yaml
+        data = yaml.safe_load(''.join(lines)) or {}
+        fields = {key: str(data[key]) for key in ('date', 'title', 'source_url') if data.get(key) is not None}
+        # Jekyll처럼 문자열 카테고리는 공백으로 나눔
+        categories = data.get('categories') or []
+        categories = categories.split() if isinstance(categories, str) else [str(category) for category in categories]
+
+    match = POST_FILENAME_PATTERN.match(os.path.basename(filepath))
+    date = fields.get('date') or (f"{match.group(1)}-{match.group(2)}-{match.group(3)}" if match else '')
+    return [date[:19], fields.get('title', ''), fields.get('source_url'), categories]
+
+def jekyll_post_url(name, baseurl=""):
+    """Jekyll permalink (/:year/:month/:day/:title/)와 같은 포스트 주소"""
+    year, month, day, slug = POST_FILENAME_PATTERN.match(name).groups()
+    return f"{baseurl.rstrip('/')}/{year}/{month}/{day}/{quote(slug)}/"
+
+def signature(*parts):
+    """페이지 구성의 해시 (같으면 다시 쓰지 않음)"""
+    digest = hashlib.blake2b(digest_size=12)
+    digest.update(str(RENDER_VERSION).encode())
+    for part in parts:
+        digest.update(b'\x1e')
+        digest.update(json.dumps(part, ensure_ascii=False).encode('utf-8'))
+    return digest.hexdigest()
+
+def text(value):
+    """HTML 이스케이프 (Liquid 태그로 해석되지 않도록 중괄호도 이스케이프)"""
+    return escape(value).replace('{', '&#123;').replace('}', '&#125;')
+
+class SiteIndex:
+    """포스트 메타데이터와 생성한 페이지의 구성 해시 (실행 간 유지)"""
+
+    def __init__(self, path=DEFAULT_SITE_INDEX_PATH):
+        self.path = path
+        self.posts = {}  # 파일명 -> [날짜, 제목, 원문 링크, 카테고리 목록]
+        self.pages = {}  # 저장소 기준 경로 -> 구성 해시
+        self.dirty = False
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            # 버전 1은 카테고리를 기록하지 않았으므로 포스트 메타데이터를 다시 읽음
+            self.posts = data.get("posts", {}) if data.get("version") == INDEX_VERSION else {}
+            self.pages = data.get("pages", {})
+
+    def save(self):
+        """인덱스 저장 (임시 파일에 쓴 뒤 교체)"""
+        if not self.dirty:
+            return
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({"version": INDEX_VERSION, "posts": self.posts, "pages": self.pages}, f, ensure_ascii=False,
+                      indent=0, sort_keys=True)
+        os.replace(tmp_path, self.path)
+        self.dirty = False
+
+    def sync(self, posts_dir):
+        """_posts 디렉토리와 맞추기 (새 포스트의 front matter만 읽음) → (추가 수, 삭제 수)"""
+        filenames = {name for name in os.listdir(posts_dir) if POST_FILENAME_PATTERN.match(name)} \
+            if os.path.isdir(posts_dir) else set()
+
+        removed = [name for name in self.posts if name not in filenames]
+        for name in removed:
+            del self.posts[name]
+
+        added = 0
+        for name in filenames:
+            if name not in self.posts:
+                meta = read_post_meta(os.path.join(posts_dir, name))
+                if meta:
+                    self.posts[name] = meta
+                    added += 1
+
+        if added or removed:
+            self.dirty = True
+        return added, len(removed)
+
+class SitePages:
+    """목록·아카이브·사이트맵 페이지 생성기"""
+
+    def __init__(self, root, index, site_url="", baseurl="", page_size=DEFAULT_PAGE_SIZE):
+        self.root = root
+        self.index = index
+        self.site_url = site_url.rstrip('/')
+        self.baseurl = baseurl.rstrip('/')
+        self.page_size = page_size
+        self.changed = []
+
+    def url(self, path):
+        return f"{self.baseurl}{path}"
+
+    def post_url(self, name):
+        return jekyll_post_url(name, self.baseurl)
+
+    def write(self, relpath, page_signature, render):
+        """구성이 바뀐 페이지만 렌더링하여 저장"""
+        path = os.path.join(self.root, relpath)
+        if self.index.pages.get(relpath) == page_signature and os.path.exists(path):
+            return
+
+        content = render()
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                unchanged = f.read() == content
+        except FileNotFoundError:
+            unchanged = False
+
+        if not unchanged:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+            self.changed.append(path)
+
+        self.index.pages[relpath] = page_signature
+        self.index.dirty = True
+
+    def remove_stale(self, current):
+        """더 이상 생성하지 않는 페이지 삭제 (포스트가 지워져 페이지·월이 줄어든 경우)"""
+        for relpath in [relpath for relpath in self.index.pages if relpath not in current]:
+            path = os.path.join(self.root, relpath)
+            if os.path.exists(path):
+                os.remove(path)
+                self.changed.append(path)
+            del self.index.pages[relpath]
+            self.index.dirty = True
+
+    def post_items(self, names):
+        """포스트 목록 HTML (홈 레이아웃과 같은 마크업: 날짜·카테고리·제목, 최신순)"""
+        items = []
+        for name in reversed(names):
+            date, title, source_url, categories = self.index.posts[name]
+            href = source_url or self.post_url(name)
+            target = ' target="_blank" rel="noopener"' if source_url else ''
+            tags = ''.join(f'<span class="category-tag">{text(category.upper())}</span>' for category in categories)
+            items.append(
+                f'  <li>\n'
+                f'    <span class="post-meta">{date[:10].replace("-", ". ")}</span>\n'
+                + (f'    <div class="post-categories">{tags}</div>\n' if tags else '') +
+                f'    <h3><a class="post-link" href="{text(href)}"{target}>{text(title)}</a></h3>\n'
+                f'  </li>\n'
+            )
+        return '<ul class="post-list">\n' + ''.join(items) + '</ul>\n'
+
+    def pager(self, newer=None, older=None):
+        links = []
+        if newer:
+            links.append(f'<a class="pager-newer" href="{text(newer[1])}">← {text(newer[0])}</a>')
+        if older:
+            links.append(f'<a class="pager-older" href="{text(older[1])}">{text(older[0])} →</a>')
+        return f'<nav class="pagination">\n  {" ".join(links)}\n</nav>\n' if links else ''
+
+    def page(self, title, body):
+        """Jekyll 페이지 (post_list 레이아웃, 본문은 미리 렌더링한 HTML)"""
+        return f"---\nlayout: post_list\ntitle: {json.dumps(title, ensure_ascii=False)}\n---\n\n{body}"
+
+    def generate(self):
+        """모든 페이지를 구성 해시와 비교하여 갱신 → 바뀌거나 삭제된 파일 경로 목록"""
+        names = sorted(self.index.posts, key=lambda name: (self.index.posts[name][0], name))
+        current = set()
+
+        # 목록 페이지: 1페이지가 가장 오래된 포스트 (새 포스트는 마지막 페이지에만 추가됨)
+        chunks = [names[i:i + self.page_size] for i in range(0, len(names), self.page_size)]
+        total = len(chunks)
+        for number, chunk in enumerate(chunks, 1):
+            relpath = os.path.join(PAGES_DIR, str(number), "index.html")
+            newer = ("최신 기사", self.url(f"/{PAGES_DIR}/{number + 1}/")) if number < total else ("홈", self.url("/"))
+            older = ("이전 기사", self.url(f"/{PAGES_DIR}/{number - 1}/")) if number > 1 else None
+            current.add(relpath)
+            self.write(relpath, signature(chunk, newer, older, self.baseurl),
+                       partial(self.list_page, f"AI 뉴스 {number}페이지", chunk, newer, older))
+
+        # 홈에서 '이전 기사' 링크에 쓰는 페이지 정보
+        pagination = {"pages": total, "latest": self.url(f"/{PAGES_DIR}/{total}/") if total else None}
+        current.add(PAGINATION_DATA)
+        self.write(PAGINATION_DATA, signature(pagination),
+                   partial(json.dumps, pagination, ensure_ascii=False, indent=2))
+
+        # 월별 아카이브와 사이트맵
+        months = [(month, list(group)) for month, group in groupby(names, key=lambda name: self.index.posts[name][0][:7])]
+        for position, (month, members) in enumerate(months):
+            newer = months[position + 1][0] if position + 1 < len(months) else None
+            older = months[position - 1][0] if position > 0 else None
+            newer = newer and (newer, self.archive_url(newer))
+            older = older and (older, self.archive_url(older))
+
+            relpath = os.path.join(ARCHIVE_DIR, *month.split('-'), "index.html")
+            current.add(relpath)
+            self.write(relpath, signature(members, newer, older, self.baseurl),
+                       partial(self.list_page, f"{month} 아카이브", members, newer, older))
+
+            relpath = os.path.join(SITEMAP_DIR, f"sitemap-{month}.xml")
+            current.add(relpath)
+            self.write(relpath, signature(members, self.site_url, self.baseurl), partial(self.sitemap, members))
+
+        counts = [(month, len(members)) for month, members in reversed(months)]
+        relpath = os.path.join(ARCHIVE_DIR, "index.html")
+        current.add(relpath)
+        self.write(relpath, signature(counts, self.baseurl), partial(self.archive_index, counts))
+
+        lastmods = [(month, max(self.index.posts[name][0] for name in members)[:10]) for month, members in months]
+        current.add(SITEMAP_INDEX)
+        self.write(SITEMAP_INDEX, signature(lastmods, self.site_url, self.baseurl), partial(self.sitemap_index, lastmods))
+
+        self.remove_stale(current)
+        return self.changed
+
+    def list_page(self, title, names, newer=None, older=None):
+        return self.page(title, self.post_items(names) + self.pager(newer, older))
+
+    def archive_url(self, month):
+        return self.url(f"/{ARCHIVE_DIR}/{month.replace('-', '/')}/")
+
+    def archive_index(self, counts):
+        """월 목록 페이지 (최신 월부터)"""
+        items = ''.join(
+            f'  <li><a class="post-link" href="{text(self.archive_url(month))}">{month}</a> '
+            f'<span class="post-meta">{count}개</span></li>\n'
+            for month, count in counts
+        )
+        return self.page("아카이브", '<ul class="archive-list">\n' + items + '</ul>\n')
+
+    def sitemap(self, names):
+        """한 달치 포스트 사이트맵 (파일 하나당 URL 5만 개 제한을 넘지 않도록 월별로 나눔)"""
+        urls = ''.join(
+            f'  <url><loc>{escape(self.site_url + self.post_url(name))}</loc>'
+            f'<lastmod>{self.index.posts[name][0][:10]}</lastmod></url>\n'
+            for name in names
+        )
+        return ('<?xml version="1.0" encoding="UTF-8"?>\n'
+                '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n' + urls + '</urlset>\n')
+
+    def sitemap_index(self, lastmods):
+        """월별 사이트맵 색인"""
+        sitemaps = ''.join(
+            f'  <sitemap><loc>{escape(f"{self.site_url}{self.baseurl}/{SITEMAP_DIR}/sitemap-{month}.xml")}</loc>'
+            f'<lastmod>{lastmod}</lastmod></sitemap>\n'
+            for month, lastmod in lastmods
+        )
+        return ('<?xml version="1.0" encoding="UTF-8"?>\n'
+                '<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n' + sitemaps + '</sitemapindex>\n')
+
+def generated_files(root):
+    """작업 트리에 있는 생성 페이지의 저장소 기준 경로 목록 (OUTPUT_PATHSPECS와 같은 범위)"""
+    patterns = [
+        os.path.join(PAGES_DIR, "*", "index.html"),
+        os.path.join(ARCHIVE_DIR, "**", "index.html"),
+        os.path.join(SITEMAP_DIR, "sitemap-*.xml"),
+        SITEMAP_INDEX,
+        PAGINATION_DATA,
+    ]
+    return [
+        os.path.relpath(path, root)
+        for pattern in patterns
+        for path in glob.glob(os.path.join(root, pattern), recursive=True)
+    ]
+
+def load_site_config(root):
+    """_config.yml의 url·baseurl"""
+    path = os.path.join(root, "_config.yml")
+    if not os.path.exists(path):
+        return "", ""
+
+    import yaml
+    with open(path, 'r', encoding='utf-8') as f:
+        config = yaml.safe_load(f) or {}
+    return str(config.get("url") or ""), str(config.get("baseurl") or "")
+
+def update_site_pages(root, posts_dir, index_path=None, page_size=DEFAULT_PAGE_SIZE, rebuild=False):
+    """포스트 변경을 반영하여 목록·아카이브·사이트맵 갱신 → 바뀌거나 삭제된 파일 경로 목록
+
+    rebuild=True면 저장한 구성 해시를 무시하고 모든 페이지를 다시 확인합니다 (내용이 같은 파일은 쓰지 않음).
+    """
+    index_path = index_path or os.path.join(root, DEFAULT_SITE_INDEX_PATH)
+    index = SiteIndex(index_path)
+    if rebuild:
+        index.pages = {relpath: None for relpath in index.pages}
+    if not os.path.exists(index_path):
+        # 인덱스가 없으면 (새로 clone한 저장소 등) 이미 있는 페이지를 모두 다시 확인하고 생성하지 않는 페이지는 지움
+        index.pages = {relpath: None for relpath in generated_files(root)}
+
+    index.sync(posts_dir)
+    site_url, baseurl = load_site_config(root)
+    changed = SitePages(root, index, site_url, baseurl, page_size).generate()
+    index.save()
+    return changed
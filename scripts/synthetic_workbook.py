@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+벤치마크용 합성 크롤링 워크북 생성기
+실제 크롤링 결과(google_ai_news_*.xlsx)와 같은 열 구성으로 한국어 제목, nate.com 링크, 선택적인 내용 열을 만듭니다.
+같은 행 수·seed면 항상 같은 워크북이 생성되므로 실행 간 결과를 비교할 수 있습니다.
+"""
+
+import os
+import sys
+import random
+
+import openpyxl
+
+# 크롤링 결과의 열 구성 (내용 열은 선택)
+COLUMNS = ['제목', '링크', '출처', '설명', '발행일', '이미지URL']
+
+SUBJECTS = ['오픈AI', '구글', '삼성전자', '네이버', '카카오', 'LG AI연구원', '엔비디아', '마이크로소프트', '메타', '앤트로픽',
+            'SK텔레콤', '과기정통부', '업스테이지', '딥마인드', '퓨리오사AI']
+TOPICS = ['생성형 AI', 'AI 반도체', '코딩 에이전트', '초거대 언어모델', 'AI 데이터센터', '온디바이스 AI', '멀티모달 모델',
+          'AI 규제', '디지털 트윈', '자율주행']
+ACTIONS = ['출시', '공개', '투자 확대', '협력 발표', '상용화 추진', '성능 개선', '서비스 개편', '전격 인수', '실증 착수',
+           '글로벌 진출']
+QUOTES = ['"시장 판도 바꿀 것"', "'바이브 코딩' 다음 단계", '…업계 긴장', '(종합)', '[단독]', '', '', '']
+SOURCES = ['한겨레', 'AI타임스', '한국경제', '전자신문', '지디넷코리아', '연합뉴스', '매일경제', '조선비즈']
+RELATIVE_DATES = ['10분 전', '3시간 전', '12시간 전', '1일 전', '2일 전', '3일 전']
+
+def synthetic_rows(rows, with_body=True, seed=0):
+    """합성 크롤링 행 생성 (링크는 행마다 고유)"""
+    rng = random.Random(seed)
+    for index in range(rows):
+        title = f"{rng.choice(SUBJECTS)}, {rng.choice(TOPICS)} {rng.choice(ACTIONS)} {rng.choice(QUOTES)}".strip()
+        summary = f"{rng.choice(SUBJECTS)}이(가) {rng.choice(TOPICS)} 분야에서 {rng.choice(ACTIONS)} 소식을 전했다. " * rng.randint(1, 3)
+        row = [
+            title,
+            f"https://news.nate.com/view/2025{rng.randint(1, 12):02d}{rng.randint(1, 28):02d}n{index:07d}",
+            rng.choice(SOURCES),
+            summary.strip(),
+            rng.choice(RELATIVE_DATES),
+            None
+        ]
+        if with_body:
+            # 본문은 일부 행에만 있음 (빈 셀 처리 경로 포함)
+            row.append(summary.strip() * 4 if rng.random() < 0.8 else None)
+        yield row
+
+def generate_workbook(path, rows, with_body=True, seed=0):
+    """합성 워크북 저장 (write-only 모드로 행 수와 관계없이 메모리 일정)"""
+    workbook = openpyxl.Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    sheet.append(COLUMNS + (['내용'] if with_body else []))
+    for row in synthetic_rows(rows, with_body, seed):
+        sheet.append(row)
+
+    tmp_path = f"{path}.tmp"
+    workbook.save(tmp_path)
+    os.replace(tmp_path, path)
+    return path
+
+def cached_workbook(directory, rows, with_body=True, seed=0):
+    """같은 조건의 합성 워크북이 있으면 재사용 (100만 행은 생성에 수 분이 걸림)"""
+    os.makedirs(directory, exist_ok=True)
+    name = f"synthetic_{rows}{'_body' if with_body else ''}_seed{seed}.xlsx"
+    path = os.path.join(directory, name)
+    if not os.path.exists(path):
+        print(f"🛠️  합성 워크북 생성: {name}")
+        generate_workbook(path, rows, with_body, seed)
+    return path
+
+if __name__ == "__main__":
+    # 사용법: python synthetic_workbook.py 출력.xlsx 행수 [--no-body]
+    if len(sys.argv) < 3:
+        print("사용법: python synthetic_workbook.py 출력.xlsx 행수 [--no-body]")
+        sys.exit(1)
+    generate_workbook(sys.argv[1], int(sys.argv[2]), with_body="--no-body" not in sys.argv[3:])
+    print(f"✅ {sys.argv[2]}행 워크북 생성: {sys.argv[1]}")
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+여러 실행에 걸쳐 이미 게시한 기사 URL을 기억하는 중복 제거 인덱스
+정규화한 URL의 64비트 해시를 정렬된 바이너리 파일로 저장하여 수십만 개도 빠르게 로드합니다.
+"""
+
+import os
+import sys
+import glob
+import hashlib
+from array import array
+from bisect import bisect_left
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+DEFAULT_INDEX_PATH = os.path.join(".automation", "seen_urls.bin")
+
+# 추적용 쿼리 파라미터 (정규화 시 제거)
+TRACKING_PARAMS = {
+    "fbclid", "gclid", "dclid", "msclkid", "igshid", "mc_cid", "mc_eid",
+    "ref", "ref_src", "cmpid", "ncid", "spm"
+}
+TRACKING_PREFIXES = ("utm_",)
+
+def canonicalize_url(url):
+    """기사 URL 정규화 (추적 파라미터·fragment 제거, 호스트 소문자화, 쿼리 정렬)"""
+    url = str(url).strip()
+    parts = urlsplit(url)
+
+    scheme = parts.scheme.lower()
+    if scheme == "http":
+        scheme = "https"
+
+    netloc = parts.netloc.lower()
+    if netloc.startswith("www."):
+        netloc = netloc[4:]
+    if netloc.endswith(":443") or netloc.endswith(":80"):
+        netloc = netloc.rsplit(":", 1)[0]
+
+    path = parts.path or "/"
+    if len(path) > 1:
+        path = path.rstrip("/")
+
+    query = [
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith(TRACKING_PREFIXES)
+    ]
+    query.sort()
+
+    return urlunsplit((scheme, netloc, path, urlencode(query), ""))
+
+def url_key(url):
+    """정규화한 URL의 64비트 해시"""
+    digest = hashlib.blake2b(canonicalize_url(url).encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'little')
+
+def iter_post_source_urls(posts_dir):
+    """_posts의 front matter에서 source_url 값 추출"""
+    for path in glob.glob(os.path.join(posts_dir, "*.md")):
+        with open(path, 'r', encoding='utf-8') as f:
+            if f.readline().strip() != "---":
+                continue
+            for line in f:
+                if line.strip() == "---":
+                    break
+                if line.startswith("source_url:"):
+                    value = line[len("source_url:"):].strip()
+                    if value[:1] in ("'", '"'):
+                        # 따옴표 안의 이스케이프('' → ', \" 등)는 PyYAML로 해석 (링크에 작은따옴표 등이 있을 때만)
+                        import yaml
+                        value = yaml.safe_load(value)
+                    yield value
+                    break
+
+class SeenUrlIndex:
+    def __init__(self, path=DEFAULT_INDEX_PATH):
+        self.path = path
+        self.keys = array('Q')
+        self.pending = set()
+
+    @classmethod
+    def load(cls, path=DEFAULT_INDEX_PATH, posts_dir=None):
+        """인덱스 파일 로드 (파일이 없고 posts_dir이 주어지면 기존 포스트에서 재구축)"""
+        index = cls(path)
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                index.keys.frombytes(f.read())
+        elif posts_dir:
+            index.rebuild(posts_dir)
+        return index
+
+    def __len__(self):
+        return len(self.keys) + len(self.pending)
+
+    def __contains__(self, url):
+        key = url_key(url)
+        if key in self.pending:
+            return True
+        position = bisect_left(self.keys, key)
+        return position < len(self.keys) and self.keys[position] == key
+
+    def add(self, url):
+        """URL 추가 (save 시 정렬된 배열에 병합)"""
+        self.pending.add(url_key(url))
+
+    def rebuild(self, posts_dir):
+        """_posts의 front matter로부터 인덱스 재구축"""
+        self.keys = array('Q')
+        self.pending = {url_key(url) for url in iter_post_source_urls(posts_dir)}
+        return len(self.pending)
+
+    def save(self):
+        """정렬된 해시 배열을 파일에 저장"""
+        if self.pending:
+            self.keys = array('Q', sorted(set(self.keys).union(self.pending)))
+            self.pending = set()
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            self.keys.tofile(f)
+        os.replace(tmp_path, self.path)
+
+if __name__ == "__main__":
+    # 기존 포스트로부터 인덱스 재구축
+    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    posts_dir = sys.argv[1] if len(sys.argv) > 1 else os.path.join(project_root, "_posts")
+
+    index = SeenUrlIndex(os.path.join(project_root, DEFAULT_INDEX_PATH))
+    count = index.rebuild(posts_dir)
+    index.save()
+    print(f"✅ {count}개의 URL로 인덱스를 재구축했습니다: {index.path}")
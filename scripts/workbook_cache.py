@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+파싱한 워크북의 열 기반 캐시
+pd.read_excel 결과를 시트마다 Arrow IPC 파일로 저장해 두고, 같은 워크북을 다시 읽을 때는 XML을 파싱하지 않고
+메모리 맵으로 읽습니다. 캐시 키는 워크북 경로·크기·수정 시각·내용 해시이며, 전체 크기가 한도를 넘으면
+가장 오래 쓰지 않은 항목부터 지웁니다. pyarrow가 설치되어 있지 않으면 캐시 없이 동작합니다.
+"""
+
+import os
+import glob
+import hashlib
+
+import pandas as pd
+
+from ingest_manifest import file_sha256
+
+try:
+    import pyarrow as pa
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+DEFAULT_CACHE_DIR = os.path.join(".automation", "workbook_cache")
+
+# 캐시 전체 크기 한도 (바이트)
+DEFAULT_MAX_BYTES = 2 * 1024 ** 3
+
+CACHE_SUFFIX = ".arrow"
+
+class WorkbookCache:
+    def __init__(self, directory=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.fingerprints = {}  # (경로, 크기, 수정 시각) -> 내용 해시 (시트마다 다시 해시하지 않도록)
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def open(cls, directory=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        """캐시 생성 (pyarrow가 없으면 None)"""
+        if not PYARROW_AVAILABLE:
+            return None
+        return cls(directory, max_bytes)
+
+    def fingerprint(self, excel_file):
+        """워크북 경로·크기·수정 시각·내용 해시를 합친 키"""
+        path = os.path.abspath(excel_file)
+        stat = os.stat(path)
+        state = (path, stat.st_size, stat.st_mtime_ns)
+        sha256 = self.fingerprints.get(state)
+        if sha256 is None:
+            sha256 = self.fingerprints[state] = file_sha256(path)
+        return "\0".join(map(str, state + (sha256,)))
+
+    def entry_path(self, excel_file, sheet_name=0):
+        key = f"{self.fingerprint(excel_file)}\0{sheet_name!r}"
+        name = hashlib.blake2b(key.encode('utf-8'), digest_size=16).hexdigest()
+        return os.path.join(self.directory, name + CACHE_SUFFIX)
+
+    def read_excel(self, excel_file, sheet_name=0):
+        """pd.read_excel과 같은 DataFrame (캐시에 있으면 Arrow 파일에서 읽음)"""
+        path = self.entry_path(excel_file, sheet_name)
+        if os.path.exists(path):
+            try:
+                df = self.load(path)
+                self.hits += 1
+                os.utime(path)  # 최근 사용 시각 갱신 (LRU)
+                return df
+            except (OSError, pa.ArrowException):
+                # 깨진 캐시 파일은 버리고 다시 파싱
+                remove_quietly(path)
+
+        self.misses += 1
+        df = pd.read_excel(excel_file, sheet_name=sheet_name)
+        self.store(path, df)
+        return df
+
+    def load(self, path):
+        """메모리 맵으로 Arrow 파일을 읽어 DataFrame으로 변환"""
+        with pa.memory_map(path, 'r') as source:
+            table = pa.ipc.open_file(source).read_all()
+        df = table.to_pandas()
+
+        # Arrow의 null은 문자열 열에서 None으로 돌아오므로 pd.read_excel처럼 NaN으로 되돌림
+        for column in df.columns:
+            if df[column].dtype == object:
+                df[column] = df[column].where(df[column].notna(), float('nan'))
+        return df
+
+    def store(self, path, df):
+        """DataFrame을 Arrow 파일로 저장 (열 이름이 문자열이 아니거나 한 열에 여러 타입이 섞이면 캐시하지 않음)"""
+        if not all(isinstance(column, str) for column in df.columns):
+            return False
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+        except (pa.ArrowException, ValueError, TypeError):
+            return False
+
+        os.makedirs(self.directory, exist_ok=True)
+        # 병렬 변환 워커가 같은 항목을 동시에 쓸 수 있으므로 프로세스별 임시 파일에 쓴 뒤 교체
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            # 압축하지 않아야 읽을 때 메모리 맵을 그대로 사용
+            with pa.OSFile(tmp_path, 'wb') as sink:
+                with pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            remove_quietly(tmp_path)
+            print(f"⚠️  워크북 캐시 저장 실패: {e}")
+            return False
+
+        self.evict(keep=path)
+        return True
+
+    def entries(self):
+        """[(최근 사용 시각, 크기, 경로), ...] (오래된 순)"""
+        entries = []
+        for path in glob.glob(os.path.join(self.directory, "*" + CACHE_SUFFIX)):
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue  # 다른 프로세스가 방금 지움
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+        return sorted(entries)
+
+    def size(self):
+        return sum(size for _, size, _ in self.entries())
+
+    def evict(self, keep=None):
+        """전체 크기가 한도 이하가 될 때까지 가장 오래 쓰지 않은 항목 삭제"""
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            remove_quietly(path)
+            total -= size
+            removed += 1
+        return removed
+
+    def clear(self):
+        """캐시 항목 모두 삭제"""
+        entries = self.entries()
+        for _, _, path in entries:
+            remove_quietly(path)
+        return len(entries)
+
+def remove_quietly(path):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
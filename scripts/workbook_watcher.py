@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+새 크롤링 워크북 감시
+Linux에서는 inotify(ctypes)로, 그 밖의 환경에서는 주기적인 디렉토리 스캔으로 *.xlsx(와 지정한 패턴의 입력 파일) 생성·수정을 감지합니다.
+쓰기가 끝나지 않은 파일은 크기·수정 시각이 잠시 그대로이고, xlsx는 온전한 zip일 때까지 기다렸다가 넘겨줍니다.
+"""
+
+import os
+import sys
+import time
+import errno
+import select
+import signal
+import struct
+import fnmatch
+import zipfile
+
+# inotify 상수 (<sys/inotify.h>)
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+EVENT_HEADER = struct.Struct("iIII")
+
+class InotifyWatcher:
+    """inotify로 디렉토리 하나의 파일 변경 감시"""
+
+    def __init__(self, directory):
+        import ctypes
+        import ctypes.util
+
+        self.libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self.fd = self.libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 실패")
+
+        mask = IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_MODIFY
+        if self.libc.inotify_add_watch(self.fd, os.fsencode(directory), mask) < 0:
+            error = ctypes.get_errno()
+            os.close(self.fd)
+            raise OSError(error, f"inotify_add_watch 실패: {directory}")
+
+    def wait(self, timeout):
+        """timeout초 동안 변경된 파일 이름 집합 반환"""
+        readable, _, _ = select.select([self.fd], [], [], timeout)
+        if not readable:
+            return set()
+
+        names = set()
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except OSError as e:
+                if e.errno == errno.EAGAIN:
+                    break
+                raise
+
+            offset = 0
+            while offset < len(data):
+                _, _, _, length = EVENT_HEADER.unpack_from(data, offset)
+                offset += EVENT_HEADER.size
+                name = data[offset:offset + length].rstrip(b"\0")
+                offset += length
+                if name:
+                    names.add(os.fsdecode(name))
+        return names
+
+    def close(self):
+        os.close(self.fd)
+
+class PollingWatcher:
+    """디렉토리를 주기적으로 스캔하여 크기·수정 시각이 바뀐 파일 감지 (inotify를 쓸 수 없을 때)"""
+
+    def __init__(self, directory, interval=1.0):
+        self.directory = directory
+        self.interval = interval
+        self.snapshot = self.scan()
+
+    def scan(self):
+        snapshot = {}
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    stat = entry.stat()
+                    snapshot[entry.name] = (stat.st_size, stat.st_mtime_ns)
+        return snapshot
+
+    def wait(self, timeout):
+        """timeout초(최대 스캔 간격) 뒤 변경된 파일 이름 집합 반환"""
+        time.sleep(min(timeout, self.interval))
+        snapshot = self.scan()
+        names = {name for name, state in snapshot.items() if self.snapshot.get(name) != state}
+        self.snapshot = snapshot
+        return names
+
+    def close(self):
+        pass
+
+def create_watcher(directory, polling_interval=1.0):
+    """가능하면 inotify, 아니면 폴링 감시자 생성"""
+    if sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(directory)
+        except (OSError, AttributeError) as e:
+            print(f"⚠️  inotify를 사용할 수 없어 폴링으로 감시합니다: {e}")
+    return PollingWatcher(directory, polling_interval)
+
+def stop_on_signal(signum, frame):
+    raise KeyboardInterrupt
+
+def install_stop_handler():
+    """SIGTERM(systemd 등의 서비스 종료)도 Ctrl+C처럼 처리하여 정리 작업을 마치고 종료"""
+    signal.signal(signal.SIGTERM, stop_on_signal)
+
+def file_state(path):
+    """(크기, 수정 시각) (파일이 없으면 None)"""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+class WorkbookWatcher:
+    """새로 생기거나 바뀐 워크북을 쓰기가 끝난 뒤 한 번씩 넘겨줌"""
+
+    def __init__(self, directory, patterns=("*.xlsx",), debounce=0.5, polling_interval=1.0):
+        self.directory = directory
+        self.patterns = patterns
+        self.debounce = debounce
+        self.watcher = create_watcher(directory, polling_interval)
+        self.pending = {}  # 파일 이름 -> (마지막 변경 시각, 파일 상태)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+    def is_workbook(self, name):
+        # Excel 잠금 파일(~$*.xlsx)과 숨김 임시 파일은 제외
+        return any(fnmatch.fnmatch(name, pattern) for pattern in self.patterns) and not name.startswith(("~$", "."))
+
+    def poll(self, timeout=1.0):
+        """쓰기가 끝난 워크북 경로 목록 (없으면 timeout초 뒤 빈 목록)"""
+        wait = min(timeout, self.debounce) if self.pending else timeout
+
+        for name in self.watcher.wait(wait):
+            if self.is_workbook(name):
+                self.pending[name] = (time.monotonic(), file_state(os.path.join(self.directory, name)))
+
+        ready = []
+        now = time.monotonic()
+        for name, (changed_at, state) in list(self.pending.items()):
+            path = os.path.join(self.directory, name)
+            current = file_state(path)
+            if current is None:
+                del self.pending[name]  # 임시 파일이 옮겨지거나 삭제됨
+            elif current != state:
+                self.pending[name] = (now, current)  # 아직 쓰는 중
+            elif now - changed_at >= self.debounce:
+                del self.pending[name]
+                if not name.endswith(".xlsx") or zipfile.is_zipfile(path):
+                    ready.append(path)
+                else:
+                    # xlsx는 zip 파일이므로 아직 온전하지 않으면 다음 변경을 기다림
+                    print(f"⚠️  아직 완성되지 않은 워크북: {name}")
+        return sorted(ready)
+
+    def close(self):
+        self.watcher.close()